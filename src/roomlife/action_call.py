@@ -1,31 +1,55 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Tuple
 
+# Legacy action id prefixes, in the order from_legacy tests them
+_LEGACY_PREFIXES = ("move_", "repair_", "purchase_", "sell_", "discard_", "apply_job_")
 
-@dataclass(frozen=True)
+
+@lru_cache(maxsize=1024)
+def _parse_legacy_id(action_id: str) -> Tuple[str, str]:
+    """Split a legacy action id into (prefix, suffix).
+
+    The prefix is "" when no legacy prefix matches. Action ids are stable
+    strings polled repeatedly by the UI, so the parse is cached. Suffixes
+    are interned so they share identity with the interned item/space ids
+    they are looked up against.
+    """
+    for prefix in _LEGACY_PREFIXES:
+        if action_id.startswith(prefix):
+            return prefix, sys.intern(action_id[len(prefix):])
+    return "", action_id
+
+
+@dataclass(slots=True, frozen=True)
 class ActionCall:
     action_id: str
-    params: Dict[str, Any]
+    params: Mapping[str, Any]
 
     @staticmethod
     def from_legacy(action_id: str) -> "ActionCall":
         if action_id == "cook_meal":
             return ActionCall("cook_basic_meal", {})
-        if action_id.startswith("move_"):
-            return ActionCall("move", {"target_space": action_id[len("move_"):]})
-        if action_id.startswith("repair_"):
-            return ActionCall(
-                "repair_item",
-                {"item_ref": {"mode": "by_item_id", "item_id": action_id[len("repair_"):]}},
-            )
-        if action_id.startswith("purchase_"):
-            return ActionCall("purchase_item", {"item_id": action_id[len("purchase_"):]})
-        if action_id.startswith("sell_"):
-            return ActionCall("sell_item", {"item_id": action_id[len("sell_"):]})
-        if action_id.startswith("discard_"):
-            return ActionCall("discard_item", {"item_id": action_id[len("discard_"):]})
-        if action_id.startswith("apply_job_"):
-            return ActionCall("apply_job", {"job_id": action_id[len("apply_job_"):]})
-        return ActionCall(action_id, {})
+        prefix, suffix = _parse_legacy_id(action_id)
+        build = _LEGACY_BUILDERS.get(prefix)
+        if build is not None:
+            return build(suffix)
+        return ActionCall(sys.intern(action_id), {})
+
+
+# Legacy prefix -> builder taking the id suffix; one dict lookup replaces the
+# per-prefix comparison chain in from_legacy
+_LEGACY_BUILDERS: Dict[str, Callable[[str], ActionCall]] = {
+    "move_": lambda suffix: ActionCall("move", {"target_space": suffix}),
+    "repair_": lambda suffix: ActionCall(
+        "repair_item",
+        {"item_ref": {"mode": "by_item_id", "item_id": suffix}},
+    ),
+    "purchase_": lambda suffix: ActionCall("purchase_item", {"item_id": suffix}),
+    "sell_": lambda suffix: ActionCall("sell_item", {"item_id": suffix}),
+    "discard_": lambda suffix: ActionCall("discard_item", {"item_id": suffix}),
+    "apply_job_": lambda suffix: ActionCall("apply_job", {"job_id": suffix}),
+}
@@ -6,14 +6,18 @@ outcomes for actions defined in YAML specifications.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 import random
 import logging
+import sys
 
 from .models import State, Item, generate_instance_id
 from .action_call import ActionCall
 from .content_specs import ActionSpec, ItemMeta
-from .constants import MAX_EVENT_LOG, SKILL_TO_APTITUDE
+from .constants import JOBS, MAX_EVENT_LOG, SKILL_TO_APTITUDE
+from . import social
 from .param_resolver import (
     apply_drop,
     apply_pickup,
@@ -30,6 +34,78 @@ class ConsumeError(RuntimeError):
     pass
 
 
+@dataclass(frozen=True)
+class ValidationContext:
+    """Item lookups shared by many validations against an unchanged state.
+
+    Attributes:
+        location: Space id the context was built for
+        reachable_item_ids: Item ids at the location or in inventory
+        reachable_provides: Capabilities and tags offered by reachable items
+        items_by_location: Items grouped by placed_in (see State.items_by_location)
+        first_reachable: First reachable instance of each item id, in state order
+        items_by_instance: instance_id -> Item for every item (first instance wins)
+        reachable_items: Items at the location or in inventory, in state order
+    """
+    location: str
+    reachable_item_ids: FrozenSet[str]
+    reachable_provides: FrozenSet[str]
+    items_by_location: Dict[str, List[Item]] = field(default_factory=dict)
+    first_reachable: Dict[str, Item] = field(default_factory=dict)
+    items_by_instance: Dict[str, Item] = field(default_factory=dict)
+    reachable_items: List[Item] = field(default_factory=list)
+
+
+def build_validation_context(state: State, item_meta: Dict[str, ItemMeta]) -> ValidationContext:
+    """Scan items once for a batch of validate_action_spec calls.
+
+    The context is only valid while the state is not mutated; callers build it
+    at the start of a listing pass and discard it afterwards.
+
+    Args:
+        state: Game state
+        item_meta: Item metadata registry
+
+    Returns:
+        ValidationContext for the player's current location
+    """
+    location = state.world.location
+    first_reachable: Dict[str, Item] = {}
+    provides: set[str] = set()
+    by_location: Dict[str, List[Item]] = {}
+    by_instance: Dict[str, Item] = {}
+    reachable: List[Item] = []
+    for it in state.items:
+        if it.instance_id not in by_instance:
+            by_instance[it.instance_id] = it
+        placed_in = it.placed_in
+        bucket = by_location.get(placed_in)
+        if bucket is None:
+            by_location[placed_in] = [it]
+        else:
+            bucket.append(it)
+        if placed_in != location and placed_in != "inventory":
+            continue
+        reachable.append(it)
+        if it.item_id in first_reachable:
+            # Duplicate instances add no new ids or capabilities
+            continue
+        first_reachable[it.item_id] = it
+        meta = item_meta.get(it.item_id)
+        if meta:
+            provides.update(meta.provides)
+            provides.update(meta.tags)
+    return ValidationContext(
+        location,
+        frozenset(first_reachable),
+        frozenset(provides),
+        by_location,
+        first_reachable,
+        by_instance,
+        reachable,
+    )
+
+
 def _required_provides(spec: ActionSpec) -> set[str]:
     """Extract all 'provides' capabilities that are required by an action.
 
@@ -47,6 +123,62 @@ def _required_provides(spec: ActionSpec) -> set[str]:
     return out
 
 
+def _check_repair_params(
+    state: State,
+    spec: ActionSpec,
+    params: Mapping[str, Any],
+    by_instance: Optional[Dict[str, Item]],
+) -> List[str]:
+    """Missing requirements for the item a repair_item call refers to."""
+    item_ref = params.get("item_ref")
+    item = (
+        select_item_instance(state, item_ref, by_instance)
+        if isinstance(item_ref, dict)
+        else None
+    )
+    if item is None:
+        return ["repair item not found"]
+    if item.condition_value >= 90:
+        return ["item already pristine"]
+    cost = compute_repair_cost(state, spec, item)
+    if state.player.money_pence < cost:
+        return [f"need {cost}p (have {state.player.money_pence}p)"]
+    return []
+
+
+# Spec id -> check that depends on the call's param values. validate_action_spec
+# runs these, and param_values_affect_validation treats every listed spec as
+# param-dependent, so a new entry can't be shared across a listing pass by mistake.
+_PARAM_CHECKS: Dict[
+    str,
+    Callable[[State, ActionSpec, Mapping[str, Any], Optional[Dict[str, Item]]], List[str]],
+] = {
+    "repair_item": _check_repair_params,
+}
+
+
+def param_values_affect_validation(spec: ActionSpec) -> bool:
+    """Whether validate_action_spec can give different results for different params.
+
+    False when every parameter is a plain string (only its type is checked),
+    no location requirement refers to a parameter, and the spec has no
+    param-specific checks. Such a spec validates identically for all
+    well-typed params, so one result can be shared across a listing pass.
+
+    Args:
+        spec: Action specification
+
+    Returns:
+        True if params must be validated per call
+    """
+    if spec.id in _PARAM_CHECKS:
+        return True
+    loc_req = (spec.requires or {}).get("location") or {}
+    if "connected_to_param" in loc_req:
+        return True
+    return any(p.get("type") != "string" for p in spec.parameters or [])
+
+
 def _select_inventory_instance(state: State, item_id: str) -> Optional[Item]:
     """Select a reachable instance for sell/discard using lowest durability first.
 
@@ -57,18 +189,20 @@ def _select_inventory_instance(state: State, item_id: str) -> Optional[Item]:
     Returns:
         Item instance, or None if not found
     """
-    candidates = [
-        it for it in state.items
-        if it.item_id == item_id and it.placed_in in ("inventory", state.world.location)
-    ]
-    if not candidates:
-        return None
+    location = state.world.location
+    # Single pass, no intermediate list or sort: only the minimum is needed.
     # Deterministic: lowest condition_value first, then instance_id for stable tie-breaking
-    candidates.sort(key=lambda it: (getattr(it, "condition_value", 100), it.instance_id))
-    return candidates[0]
+    return min(
+        (
+            it for it in state.items
+            if it.item_id == item_id and (it.placed_in == "inventory" or it.placed_in == location)
+        ),
+        key=lambda it: (getattr(it, "condition_value", 100), it.instance_id),
+        default=None,
+    )
 
 
-def _resolve_item_for_sell_or_discard(state: State, params: Dict[str, Any]) -> Optional[Item]:
+def _resolve_item_for_sell_or_discard(state: State, params: Mapping[str, Any]) -> Optional[Item]:
     """Resolve item instance from params for sell or discard actions.
 
     Supports both item_ref (instance_id mode) and item_id (legacy mode).
@@ -86,9 +220,9 @@ def _resolve_item_for_sell_or_discard(state: State, params: Dict[str, Any]) -> O
         if isinstance(item_ref, dict) and item_ref.get("mode") == "instance_id":
             instance_id = item_ref.get("instance_id")
             if instance_id:
-                for item in state.items:
-                    if item.instance_id == instance_id:
-                        return item
+                found = next((it for it in state.items if it.instance_id == instance_id), None)
+                if found is not None:
+                    return found
     # Back-compat: item_id picks lowest durability first
     if "item_id" in params:
         return _select_inventory_instance(state, params["item_id"])
@@ -220,6 +354,7 @@ def _find_best_item_for_provides(
     item_meta: Dict[str, ItemMeta],
     provides: str,
     location: str,
+    ctx: Optional[ValidationContext] = None,
 ) -> Optional[Item]:
     """Find the best item that provides a given capability.
 
@@ -230,6 +365,8 @@ def _find_best_item_for_provides(
         item_meta: Item metadata registry
         provides: Capability to search for (e.g., "heat_source")
         location: Location to search in
+        ctx: Optional pre-built lookups; its reachable items are used when it
+            was built for the same location
 
     Returns:
         Best matching item, or None if no match found
@@ -237,10 +374,13 @@ def _find_best_item_for_provides(
     best: Optional[Item] = None
     best_score = -1.0
 
-    candidates = [
-        it for it in state.items
-        if it.placed_in == location or it.placed_in == "inventory"
-    ]
+    if ctx is not None and ctx.location == location:
+        candidates = ctx.reachable_items
+    else:
+        candidates = [
+            it for it in state.items
+            if it.placed_in == location or it.placed_in == "inventory"
+        ]
     for it in candidates:
         meta = item_meta.get(it.item_id)
         if not meta:
@@ -257,11 +397,25 @@ def _find_best_item_for_provides(
     return best
 
 
+def _provides_reachable(
+    state: State,
+    item_meta: Dict[str, ItemMeta],
+    provides: str,
+    ctx: Optional[ValidationContext],
+) -> bool:
+    """Whether an item at the player's location or in inventory provides a capability."""
+    if ctx is not None:
+        return provides in ctx.reachable_provides
+    location = state.world.location
+    return _find_best_item_for_provides(state, item_meta, provides, location) is not None
+
+
 def validate_action_spec(
     state: State,
     spec: ActionSpec,
     item_meta: Dict[str, ItemMeta],
-    params: Dict[str, Any] | None = None,
+    params: Mapping[str, Any] | None = None,
+    ctx: Optional[ValidationContext] = None,
 ) -> Tuple[bool, str, List[str]]:
     """Validate if an action can be executed.
 
@@ -269,6 +423,8 @@ def validate_action_spec(
         state: Current game state
         spec: Action specification
         item_meta: Item metadata registry
+        params: Action parameters
+        ctx: Optional precomputed item lookups (see build_validation_context)
 
     Returns:
         Tuple of (is_valid, reason, missing_requirements)
@@ -320,28 +476,27 @@ def validate_action_spec(
     # any_provides: at least one item with any of these capabilities
     any_provides = item_req.get("any_provides", [])
     if any_provides:
-        ok = False
-        for prov in any_provides:
-            if _find_best_item_for_provides(state, item_meta, prov, state.world.location) is not None:
-                ok = True
-                break
+        ok = any(_provides_reachable(state, item_meta, prov, ctx) for prov in any_provides)
         if not ok:
             missing.append(f"item provides any_of={any_provides}")
 
     # all_provides: item(s) with all of these capabilities
     all_provides = item_req.get("all_provides", [])
     for prov in all_provides:
-        if _find_best_item_for_provides(state, item_meta, prov, state.world.location) is None:
+        if not _provides_reachable(state, item_meta, prov, ctx):
             missing.append(f"item provides {prov}")
 
     # has_item_ids: specific items must be present
     has_item_ids = item_req.get("has_item_ids", [])
     if has_item_ids:
-        owned = {
-            it.item_id
-            for it in state.items
-            if it.placed_in in (state.world.location, "inventory")
-        }
+        if ctx is not None:
+            owned = ctx.reachable_item_ids
+        else:
+            owned = {
+                it.item_id
+                for it in state.items
+                if it.placed_in in (state.world.location, "inventory")
+            }
         for iid in has_item_ids:
             if iid not in owned:
                 missing.append(f"need item {iid}")
@@ -352,21 +507,14 @@ def validate_action_spec(
         if _get_skill_value(state, skill) < float(minv):
             missing.append(f"skill {skill}>={minv}")
 
-    params_ok, params_missing = validate_parameters(state, spec, params)
+    by_instance = ctx.items_by_instance if ctx is not None else None
+    params_ok, params_missing = validate_parameters(state, spec, params, by_instance)
     if not params_ok:
         missing.extend(params_missing)
 
-    if spec.id == "repair_item":
-        item_ref = params.get("item_ref")
-        item = select_item_instance(state, item_ref) if isinstance(item_ref, dict) else None
-        if item is None:
-            missing.append("repair item not found")
-        elif item.condition_value >= 90:
-            missing.append("item already pristine")
-        else:
-            cost = compute_repair_cost(state, spec, item)
-            if state.player.money_pence < cost:
-                missing.append(f"need {cost}p (have {state.player.money_pence}p)")
+    param_check = _PARAM_CHECKS.get(spec.id)
+    if param_check is not None:
+        missing.extend(param_check(state, spec, params, by_instance))
 
     if missing:
         return False, "Missing requirements", missing
@@ -400,6 +548,7 @@ def compute_tier(
     spec: ActionSpec,
     item_meta: Dict[str, ItemMeta],
     rng_seed: int,
+    ctx: Optional[ValidationContext] = None,
 ) -> int:
     """Compute the outcome tier for an action.
 
@@ -411,6 +560,7 @@ def compute_tier(
         spec: Action specification
         item_meta: Item metadata registry
         rng_seed: Random seed for deterministic outcomes
+        ctx: Optional pre-built item lookups for an unchanged state
 
     Returns:
         Tier from 0 (fail/partial) to 3 (great), clamped to tier_floor
@@ -433,7 +583,7 @@ def compute_tier(
     weights = mods.get("item_provides_weights") or {}
     item_bonus = 0.0
     for prov, w in weights.items():
-        it = _find_best_item_for_provides(state, item_meta, prov, state.world.location)
+        it = _find_best_item_for_provides(state, item_meta, prov, state.world.location, ctx)
         if it is None:
             continue
         cond = float(getattr(it, "condition_value", 100)) / 100.0
@@ -519,9 +669,10 @@ def apply_outcome(
     # Grant items
     grants = outcome.get("grants", {})
     for it in grants.get("items", []) if grants else []:
-        item_id = it["item_id"]
+        # Interned like item ids loaded from items_meta.yaml
+        item_id = sys.intern(it["item_id"])
         qty = int(it.get("quantity", 1))
-        placed_in = it.get("placed_in", state.world.location)
+        placed_in = sys.intern(it.get("placed_in", state.world.location))
 
         for _ in range(qty):
             state.items.append(Item(
@@ -548,10 +699,11 @@ def preview_tier_distribution(
     item_meta: Dict[str, ItemMeta],
     rng_seed: int,
     samples: int = 9,
+    ctx: Optional[ValidationContext] = None,
 ) -> Dict[int, float]:
     counts = {0: 0, 1: 0, 2: 0, 3: 0}
     for i in range(samples):
-        tier = compute_tier(state, spec, item_meta, rng_seed=rng_seed + i * 1000)
+        tier = compute_tier(state, spec, item_meta, rng_seed=rng_seed + i * 1000, ctx=ctx)
         counts[tier] += 1
     return {k: v / samples for k, v in counts.items()}
 
@@ -578,6 +730,7 @@ def build_preview_notes(
     spec: ActionSpec,
     item_meta: Dict[str, ItemMeta],
     action_call: Any,
+    ctx: Optional[ValidationContext] = None,
 ) -> List[str]:
     notes = []
     primary = (spec.modifiers or {}).get("primary_skill")
@@ -585,7 +738,7 @@ def build_preview_notes(
         notes.append(f"Primary skill: {primary} ({_get_skill_value(state, primary):.1f})")
     weights = (spec.modifiers or {}).get("item_provides_weights") or {}
     for prov in weights:
-        if _find_best_item_for_provides(state, item_meta, prov, state.world.location) is None:
+        if not _provides_reachable(state, item_meta, prov, ctx):
             notes.append(f"Optional improvement: item providing '{prov}'")
     if spec.parameters:
         for p in spec.parameters:
@@ -713,18 +866,69 @@ def degrade_item_condition(item: Item, base_degradation: int = 5) -> None:
     update_item_condition(item)
 
 
-def compute_repair_cost(state: State, spec: ActionSpec, item: Item) -> int:
-    formula = (spec.dynamic or {}).get("cost_formula", {})
-    base_per_damage = int(formula.get("base_per_damage_pence", 10))
-    min_cost = int(formula.get("min_cost_pence", 50))
-    discount_per_point = float(formula.get("skill_discount_per_point", 2))
-    damage = max(0, 100 - int(item.condition_value))
+@lru_cache(maxsize=4096)
+def _repair_cost(
+    condition_value: int,
+    maintenance_skill: float,
+    base_per_damage: int,
+    min_cost: int,
+    discount_per_point: float,
+) -> int:
+    """Pure repair cost formula, memoized on its inputs.
+
+    Condition values are integers in 0-100 and skills change slowly, so
+    repeated listings of the same items hit the cache.
+    """
+    damage = max(0, 100 - condition_value)
     base_cost = damage * base_per_damage
-    maintenance_skill = _get_skill_value(state, "maintenance")
     discount = maintenance_skill * discount_per_point
     return max(min_cost, int(base_cost - discount))
 
 
+def compute_repair_cost(state: State, spec: ActionSpec, item: Item) -> int:
+    formula = (spec.dynamic or {}).get("cost_formula", {})
+    return _repair_cost(
+        int(item.condition_value),
+        _get_skill_value(state, "maintenance"),
+        int(formula.get("base_per_damage_pence", 10)),
+        int(formula.get("min_cost_pence", 50)),
+        float(formula.get("skill_discount_per_point", 2)),
+    )
+
+
+def _utilities_cost(resource_management: float, frugality: int, discount_pence: int) -> int:
+    """Pure utilities bill formula on plain scalars."""
+    base_cost = 2000
+    resource_mgmt_discount = resource_management * 10
+    frugality_discount = frugality / 100.0 * 200
+    return max(0, int(base_cost - resource_mgmt_discount - frugality_discount - discount_pence))
+
+
+def compute_utilities_cost(state: State) -> int:
+    """Utilities bill after skill, trait and negotiated discounts.
+
+    The utilities_discount_pence flag is set by negotiate_utilities.
+    """
+    player = state.player
+    return _utilities_cost(
+        player.skills_detailed["resource_management"].value,
+        player.traits.frugality,
+        getattr(player, "flags", {}).get("utilities_discount_pence", 0),
+    )
+
+
+def compute_sell_price(base_price: int, condition_value: int) -> int:
+    """Sell price: 40% of base price scaled by condition, at least 100p.
+
+    Integer form of base_price * 0.4 * condition_value / 100.
+    """
+    return max(100, base_price * condition_value * 2 // 500)
+
+
+# Repair restoration multiplier per outcome tier
+_TIER_RESTORE_MULT: Dict[int, float] = {0: 0.0, 1: 0.20, 2: 0.45, 3: 0.80}
+
+
 def compute_repair_restoration(state: State, spec: ActionSpec, tier: int) -> int:
     """Compute repair restoration amount based on skill and tier.
 
@@ -742,14 +946,12 @@ def compute_repair_restoration(state: State, spec: ActionSpec, tier: int) -> int
     Returns:
         Number of condition points to restore
     """
-    TIER_RESTORE_MULT = {0: 0.0, 1: 0.20, 2: 0.45, 3: 0.80}
-
     formula = (spec.dynamic or {}).get("restoration_formula", {})
     base = float(formula.get("base", 30))
     per_skill = float(formula.get("per_skill_point", 0.5))
     maintenance_skill = _get_skill_value(state, "maintenance")
 
-    restore_points = (base + maintenance_skill * per_skill) * TIER_RESTORE_MULT.get(tier, 0.20)
+    restore_points = (base + maintenance_skill * per_skill) * _TIER_RESTORE_MULT.get(tier, 0.20)
     return int(round(restore_points))
 
 
@@ -785,8 +987,6 @@ def _apply_social_posthook(
         return
 
     # Apply social effects using social.py helper
-    from . import social
-
     social.apply_social_effects(
         state=state,
         actor_id="player",
@@ -820,9 +1020,9 @@ def execute_action(
     if spec.id == "move":
         target = action_call.params.get("target_space")
         current_location = state.world.location
-        if isinstance(target, str) and target in state.spaces:
+        to_space = state.spaces.get(target) if isinstance(target, str) else None
+        if to_space is not None:
             from_space = state.spaces.get(current_location)
-            to_space = state.spaces.get(target)
             state.world.location = target
             tier = compute_tier(state, spec, item_meta, rng_seed=rng_seed)
             apply_outcome(state, spec, tier, item_meta, current_tick, emit_events=False)
@@ -832,7 +1032,7 @@ def execute_action(
                 from_id=current_location,
                 to_id=target,
                 from_location=getattr(from_space, "name", current_location),
-                to_location=getattr(to_space, "name", target),
+                to_location=to_space.name,
             )
         else:
             _log(state, "action.failed", action_id=spec.id, reason="invalid_target")
@@ -902,7 +1102,6 @@ def execute_action(
         return
 
     if spec.id == "work":
-        from .constants import JOBS
         # Get current job details
         current_job = state.player.current_job
         job_data = JOBS.get(current_job, JOBS["recycling_collector"])
@@ -955,15 +1154,7 @@ def execute_action(
         return
 
     if spec.id == "pay_utilities":
-        # Calculate cost with discounts
-        base_cost = 2000
-        resource_mgmt_discount = state.player.skills_detailed["resource_management"].value * 10
-        frugality_discount = state.player.traits.frugality / 100.0 * 200
-
-        # Check for utilities_discount_pence flag from negotiate_utilities
-        discount_flag = getattr(state.player, "flags", {}).get("utilities_discount_pence", 0)
-
-        cost = max(0, int(base_cost - resource_mgmt_discount - frugality_discount - discount_flag))
+        cost = compute_utilities_cost(state)
 
         if state.player.money_pence < cost:
             _log(state, "action.failed", action_id=spec.id, reason="insufficient_funds")
@@ -1044,7 +1235,7 @@ def execute_action(
         rng = random.Random(rng_seed + state.world.day * 97)
         new_item = Item(
             instance_id=generate_instance_id(rng),
-            item_id=item_id,
+            item_id=sys.intern(item_id),
             placed_in=state.world.location,
             container=None,
             slot="floor",
@@ -1084,10 +1275,7 @@ def execute_action(
             _log(state, "action.failed", action_id=spec.id, reason="item_not_sellable")
             return
 
-        # Calculate sell price: 40% of base price, adjusted by condition
-        condition_multiplier = item_to_sell.condition_value / 100.0
-        sell_price = int(base_price * 0.4 * condition_multiplier)
-        sell_price = max(100, sell_price)  # Minimum sell price
+        sell_price = compute_sell_price(base_price, item_to_sell.condition_value)
 
         # Add money
         state.player.money_pence += sell_price
@@ -1138,7 +1326,6 @@ def execute_action(
         return
 
     if spec.id == "apply_job":
-        from .constants import JOBS
         from .engine import _check_job_requirements
 
         job_id = action_call.params.get("job_id")
@@ -16,6 +16,11 @@ from .engine import new_game
 from .io import load_state, save_state
 from .models import State
 
+# Shared encoder for outgoing messages. Payloads are freshly built to_dict()
+# trees, so the per-container circular-reference bookkeeping is skipped;
+# output matches json.dumps with default settings.
+_encode_json = json.JSONEncoder(check_circular=False).encode
+
 
 class VisualizationAdapter(ABC):
     """Base class for visualization adapters."""
@@ -70,7 +75,7 @@ class RESTAdapter(VisualizationAdapter):
 
     def validate_action(self, action_id: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """GET /api/actions/{action_id}/validate - Validate action."""
-        validation = self.api.validate_action(action_id, params=params)
+        validation = self.api.validate_action(action_id, params=params, include_preview=True)
         return validation.to_dict()
 
     def execute_action(
@@ -123,7 +128,7 @@ class WebSocketAdapter(VisualizationAdapter):
 
         # Send initial state
         snapshot = self.api.get_state_snapshot()
-        message = json.dumps({
+        message = _encode_json({
             "type": "state_update",
             "data": snapshot.to_dict(),
         })
@@ -148,14 +153,14 @@ class WebSocketAdapter(VisualizationAdapter):
 
         if msg_type == "get_state":
             snapshot = self.api.get_state_snapshot()
-            return json.dumps({
+            return _encode_json({
                 "type": "state_update",
                 "data": snapshot.to_dict(),
             })
 
         elif msg_type == "get_actions":
             actions = self.api.get_available_actions()
-            return json.dumps({
+            return _encode_json({
                 "type": "actions_list",
                 "data": actions.to_dict(),
             })
@@ -163,26 +168,26 @@ class WebSocketAdapter(VisualizationAdapter):
         elif msg_type == "execute_action":
             action_id = data.get("action_id")
             if action_id is None:
-                return json.dumps({
+                return _encode_json({
                     "type": "error",
                     "message": "Missing required field: action_id",
                 })
             rng_seed = data.get("rng_seed")
             result = self.api.execute_action(action_id, rng_seed)
-            return json.dumps({
+            return _encode_json({
                 "type": "action_result",
                 "data": result.to_dict(),
             })
 
         else:
-            return json.dumps({
+            return _encode_json({
                 "type": "error",
                 "message": f"Unknown message type: {msg_type}",
             })
 
     def _on_event(self, event: EventInfo) -> None:
         """Handle game events and broadcast to clients."""
-        message = json.dumps({
+        message = _encode_json({
             "type": "event",
             "data": event.to_dict(),
         })
@@ -190,7 +195,7 @@ class WebSocketAdapter(VisualizationAdapter):
 
     def _on_state_change(self, state: GameStateSnapshot) -> None:
         """Handle state changes and broadcast to clients."""
-        message = json.dumps({
+        message = _encode_json({
             "type": "state_update",
             "data": state.to_dict(),
         })
@@ -7,9 +7,22 @@ validation, and event streaming.
 
 from __future__ import annotations
 
-from copy import deepcopy
+from dataclasses import fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from .api_types import (
     ActionCategory,
@@ -18,22 +31,26 @@ from .api_types import (
     ActionResult,
     ActionValidation,
     AvailableActionsResponse,
+    EMPTY_MAPPING,
     EventInfo,
+    FrozenDict,
     GameStateSnapshot,
     ItemInfo,
     LocationInfo,
     NeedsSnapshot,
+    ReadOnlyView,
     SkillInfo,
     TraitsSnapshot,
     UtilitiesSnapshot,
     WorldInfo,
 )
-from .constants import SKILL_NAMES, SKILL_TO_APTITUDE, TIME_SLICES
+from .constants import SKILL_NAMES, SKILL_TO_APTITUDE
 from .engine import apply_action
-from .models import State
-from .content_specs import load_actions, load_item_meta
+from .models import EventLog, Item, Needs, Space, State, Traits
+from .content_specs import ActionSpec, ItemMeta, load_actions, load_item_meta
 from .action_engine import (
     build_preview_notes,
+    build_validation_context,
     preview_delta_ranges,
     preview_tier_distribution,
     validate_action_spec,
@@ -41,6 +58,138 @@ from .action_engine import (
 from .action_call import ActionCall
 from .catalog import ActionCatalog
 
+# Needs fields in declaration order (also the NeedsSnapshot constructor order)
+# so diffs run over plain tuples
+_NEEDS_FIELDS = tuple(f.name for f in fields(Needs))
+_read_needs = attrgetter(*_NEEDS_FIELDS)
+# Traits in declaration order, matching the TraitsSnapshot constructor
+_read_traits = attrgetter(*(f.name for f in fields(Traits)))
+
+_DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# (needs, money_pence, location, day, slice) captured before an action
+_DiffState = Tuple[Tuple[float, ...], int, str, int, str]
+
+# (skill, governing aptitude, aptitude reader) in snapshot order
+_SKILL_APTITUDE_PAIRS = tuple(
+    (name, SKILL_TO_APTITUDE[name], attrgetter(SKILL_TO_APTITUDE[name]))
+    for name in SKILL_NAMES
+)
+
+# Field order matches the leading LocationInfo / ItemInfo constructor arguments
+_read_space = attrgetter("space_id", "name", "kind", "base_temperature_c", "has_window")
+_read_item = attrgetter(
+    "instance_id",
+    "item_id",
+    "condition",
+    "condition_value",
+    "placed_in",
+    "slot",
+    "container",
+    "bulk",
+)
+
+# (space fields, per-item field tuples) for one space
+_LocationKey = Tuple[Tuple[Any, ...], Tuple[Tuple[Any, ...], ...]]
+
+
+def _location_key(space: Space, items: Iterable[Item]) -> _LocationKey:
+    return _read_space(space), tuple(map(_read_item, items))
+
+
+def _location_info(key: _LocationKey, connections: List[str]) -> LocationInfo:
+    return LocationInfo(
+        *key[0],
+        connections=connections,
+        items=[ItemInfo(*fields) for fields in key[1]],
+    )
+
+
+class _LazyLocations(Mapping[str, LocationInfo]):
+    """Read-only space_id -> LocationInfo mapping built on first access.
+
+    Field values are captured when the snapshot is taken, so later state
+    changes do not leak into it; only the dataclass construction is deferred.
+    Only captured data is held, so snapshots copy and pickle like plain data.
+    """
+
+    __slots__ = ("_captured", "_built")
+
+    def __init__(
+        self,
+        captured: Dict[str, Tuple[_LocationKey, List[str]]],
+        built: Optional[Dict[str, LocationInfo]] = None,
+    ) -> None:
+        self._captured = captured
+        self._built: Dict[str, LocationInfo] = built if built is not None else {}
+
+    def __getitem__(self, space_id: str) -> LocationInfo:
+        info = self._built.get(space_id)
+        if info is None:
+            info = self._built[space_id] = _location_info(*self._captured[space_id])
+        return info
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._captured)
+
+    def __len__(self) -> int:
+        return len(self._captured)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._captured)!r})"
+
+
+# Spec category string -> ActionCategory, replacing a scan over the enum
+_CATEGORY_BY_VALUE: Dict[str, ActionCategory] = {
+    category.value: category for category in ActionCategory
+}
+
+# Event ids that mark an executed action as unsuccessful
+_FAILURE_EVENTS = frozenset({"action.failed", "action.unknown", "bills.unpaid"})
+
+
+def _without_listener(
+    listeners: Tuple[Tuple[Callable[[Any], None], bool], ...],
+    callback: Callable[[Any], None],
+) -> Tuple[Tuple[Callable[[Any], None], bool], ...]:
+    """Return listeners with the first registration of callback removed."""
+    for index, (listener, _) in enumerate(listeners):
+        if listener == callback:
+            return listeners[:index] + listeners[index + 1:]
+    return listeners
+
+
+@lru_cache(maxsize=1)
+def _load_default_content() -> Tuple[Dict[str, ActionSpec], Dict[str, ItemMeta]]:
+    """Action specs and item metadata from data/, read from disk once.
+
+    Specs and metadata are frozen after load; callers copy the outer dicts.
+    """
+    actions_path = _DATA_DIR / "actions.yaml"
+    items_meta_path = _DATA_DIR / "items_meta.yaml"
+    action_specs = load_actions(actions_path) if actions_path.exists() else {}
+    item_meta = load_item_meta(items_meta_path) if items_meta_path.exists() else {}
+    return action_specs, item_meta
+
+
+def _make_call(action_id: str, params: Optional[Dict[str, Any]]) -> ActionCall:
+    """Build the call for an API request; legacy ids are expanded when params is None."""
+    if params is None:
+        return ActionCall.from_legacy(action_id)
+    return ActionCall(action_id, params)
+
+
+def _read_only(value: Any) -> Any:
+    """Freeze nested dicts so shared values can't be edited (but still copy)."""
+    if isinstance(value, dict):
+        return FrozenDict({k: _read_only(v) for k, v in value.items()})
+    return value
+
+
+def _needs_delta(old: Tuple[float, ...], new: Tuple[float, ...]) -> Dict[str, float]:
+    """Diff two needs vectors read in _NEEDS_FIELDS order, keeping only changed fields."""
+    return {name: n - o for name, o, n in zip(_NEEDS_FIELDS, old, new, strict=True) if n != o}
+
 
 class RoomLifeAPI:
     """Main API for interacting with RoomLife simulation.
@@ -56,215 +205,302 @@ class RoomLifeAPI:
             state: The current game state
         """
         self.state = state
-        self._event_listeners: List[Callable[[EventInfo], None]] = []
-        self._state_change_listeners: List[Callable[[GameStateSnapshot], None]] = []
-
-        # Load data-driven action specs
-        data_dir = Path(__file__).parent.parent.parent / "data"
-        actions_path = data_dir / "actions.yaml"
-        items_meta_path = data_dir / "items_meta.yaml"
-
-        self._action_specs = load_actions(actions_path) if actions_path.exists() else {}
-        self._item_meta = load_item_meta(items_meta_path) if items_meta_path.exists() else {}
+        # (callback, safe) pairs; rebuilt on (un)subscribe so notify iterates a frozen tuple
+        self._event_listeners: Tuple[Tuple[Callable[[EventInfo], None], bool], ...] = ()
+        self._state_change_listeners: Tuple[
+            Tuple[Callable[[GameStateSnapshot], None], bool], ...
+        ] = ()
+
+        # Load data-driven action specs (parsed once per process, copied per API)
+        action_specs, item_meta = _load_default_content()
+        self._action_specs = dict(action_specs)
+        self._item_meta = dict(item_meta)
+        self._catalog = ActionCatalog(self._action_specs, self._item_meta)
+        # One read-only requirements view per spec, shared by every card for it
+        self._requirements_by_action: Dict[str, Mapping[str, Any]] = {
+            action_id: _read_only(spec.requires) if spec.requires else EMPTY_MAPPING
+            for action_id, spec in self._action_specs.items()
+        }
+        # Specs are static, so each action's UI category is resolved once
+        self._category_by_action: Dict[str, ActionCategory] = {
+            action_id: self._get_action_category(spec.category)
+            for action_id, spec in self._action_specs.items()
+        }
+        # skill name -> ((value, rust_rate, last_tick, aptitude_value), SkillInfo)
+        self._skill_info_cache: Dict[str, Tuple[Tuple[Any, ...], SkillInfo]] = {}
+        # space_id -> (field key, LocationInfo) from the last snapshot
+        self._location_cache: Dict[str, Tuple[Tuple[Any, ...], LocationInfo]] = {}
+        # (state, fingerprint, actions) from the last get_available_actions call
+        self._available_cache: Optional[Tuple[State, Tuple[Any, ...], List[ActionMetadata]]] = None
+        # Same shape, for the full (available and locked) metadata list
+        self._metadata_cache: Optional[Tuple[State, Tuple[Any, ...], List[ActionMetadata]]] = None
+        # (event log, log version, EventInfo list) from the last snapshot
+        self._recent_events_cache: Optional[Tuple[EventLog, int, List[EventInfo]]] = None
+
+    def get_state_snapshot(
+        self,
+        *,
+        include_all_locations: bool = True,
+        include_skills: bool = True,
+        include_events: bool = True,
+        snapshot_copy: bool = False,
+    ) -> GameStateSnapshot:
+        """Get a snapshot of the current game state.
 
-    def get_state_snapshot(self) -> GameStateSnapshot:
-        """Get a complete snapshot of the current game state.
+        Args:
+            include_all_locations: Build LocationInfo for every space (O(spaces x items))
+            include_skills: Build the per-skill SkillInfo list
+            include_events: Build the recent events list
+            snapshot_copy: Copy habit_tracker into a detached dict instead of
+                returning a read-only view of the live tracker
 
         Returns:
-            GameStateSnapshot with all relevant game data
+            GameStateSnapshot with all relevant game data; omitted sections are None.
+            LocationInfo objects for unchanged spaces are shared between
+            snapshots, so treat their item lists as read-only.
         """
-        # Build current tick (handle invalid time slice gracefully)
-        try:
-            slice_index = TIME_SLICES.index(self.state.world.slice)
-        except ValueError:
-            # Invalid slice, default to 0 (morning)
-            print(f"Warning: Invalid time slice '{self.state.world.slice}', using 0")
-            slice_index = 0
-        current_tick = self.state.world.day * 4 + slice_index
+        state = self.state
+        world_s = state.world
+        player = state.player
+        needs_s = player.needs
+        traits_s = player.traits
+        aptitudes_s = player.aptitudes
+        utilities_s = state.utilities
+        spaces = state.spaces
+        location = world_s.location
 
         # Build world info
         world = WorldInfo(
-            day=self.state.world.day,
-            slice=self.state.world.slice,
-            location=self.state.world.location,
-            current_tick=current_tick,
+            day=world_s.day,
+            slice=world_s.slice,
+            location=location,
+            current_tick=world_s.current_tick,
         )
 
-        # Build needs
-        needs = NeedsSnapshot(
-            hunger=self.state.player.needs.hunger,
-            fatigue=self.state.player.needs.fatigue,
-            warmth=self.state.player.needs.warmth,
-            hygiene=self.state.player.needs.hygiene,
-            mood=self.state.player.needs.mood,
-            stress=self.state.player.needs.stress,
-            energy=self.state.player.needs.energy,
-            health=self.state.player.needs.health,
-            illness=self.state.player.needs.illness,
-            injury=self.state.player.needs.injury,
-        )
-
-        # Build traits
-        traits = TraitsSnapshot(
-            discipline=self.state.player.traits.discipline,
-            confidence=self.state.player.traits.confidence,
-            empathy=self.state.player.traits.empathy,
-            fitness=self.state.player.traits.fitness,
-            charisma=self.state.player.traits.charisma,
-            frugality=self.state.player.traits.frugality,
-            curiosity=self.state.player.traits.curiosity,
-            stoicism=self.state.player.traits.stoicism,
-            creativity=self.state.player.traits.creativity,
-        )
+        # Build needs and traits positionally from one attrgetter call each
+        needs = NeedsSnapshot(*_read_needs(needs_s))
+        traits = TraitsSnapshot(*_read_traits(traits_s))
 
         # Build utilities
         utilities = UtilitiesSnapshot(
-            power=self.state.utilities.power,
-            heat=self.state.utilities.heat,
-            water=self.state.utilities.water,
+            power=utilities_s.power,
+            heat=utilities_s.heat,
+            water=utilities_s.water,
         )
 
         # Build skills list (all skills for completeness)
-        skills = []
-        for skill_name in SKILL_NAMES:
-            skill = self.state.player.skills_detailed[skill_name]
-            aptitude_name = SKILL_TO_APTITUDE[skill_name]
-            aptitude_value = getattr(self.state.player.aptitudes, aptitude_name)
-            skills.append(SkillInfo(
-                name=skill_name,
-                value=skill.value,
-                rust_rate=skill.rust_rate,
-                last_tick=skill.last_tick,
-                aptitude=aptitude_name,
-                aptitude_value=aptitude_value,
-            ))
+        skills: Optional[List[SkillInfo]] = None
+        if include_skills:
+            skills = []
+            skills_detailed = player.skills_detailed
+            skill_cache = self._skill_info_cache
+            for skill_name, aptitude_name, read_aptitude in _SKILL_APTITUDE_PAIRS:
+                skill = skills_detailed[skill_name]
+                aptitude_value = read_aptitude(aptitudes_s)
+                key = (skill.value, skill.rust_rate, skill.last_tick, aptitude_value)
+                cached = skill_cache.get(skill_name)
+                if cached is None or cached[0] != key:
+                    info = SkillInfo(skill_name, *key[:3], aptitude_name, aptitude_value)
+                    cached = (key, info)
+                    skill_cache[skill_name] = cached
+                skills.append(cached[1])
 
         # Build aptitudes dict
         aptitudes = {
-            "logic_systems": self.state.player.aptitudes.logic_systems,
-            "social_grace": self.state.player.aptitudes.social_grace,
-            "domesticity": self.state.player.aptitudes.domesticity,
-            "vitality": self.state.player.aptitudes.vitality,
-            "body": self.state.player.aptitudes.body,
+            "logic_systems": aptitudes_s.logic_systems,
+            "social_grace": aptitudes_s.social_grace,
+            "domesticity": aptitudes_s.domesticity,
+            "vitality": aptitudes_s.vitality,
+            "body": aptitudes_s.body,
         }
 
-        # Build current location with items
-        if self.state.world.location not in self.state.spaces:
-            raise ValueError(f"Invalid location: {self.state.world.location} not found in spaces")
-        current_space = self.state.spaces[self.state.world.location]
-        current_items = self.state.get_items_at(self.state.world.location)
-        current_location = LocationInfo(
-            space_id=current_space.space_id,
-            name=current_space.name,
-            kind=current_space.kind,
-            base_temperature_c=current_space.base_temperature_c,
-            has_window=current_space.has_window,
-            connections=current_space.connections,
-            items=[ItemInfo(
-                instance_id=item.instance_id,
-                item_id=item.item_id,
-                condition=item.condition,
-                condition_value=item.condition_value,
-                placed_in=item.placed_in,
-                slot=item.slot,
-                container=item.container,
-                bulk=item.bulk,
-            ) for item in current_items],
-        )
-
-        # Build all locations
-        all_locations = {}
-        for space_id, space in self.state.spaces.items():
-            space_items = self.state.get_items_at(space_id)
-            all_locations[space_id] = LocationInfo(
-                space_id=space.space_id,
-                name=space.name,
-                kind=space.kind,
-                base_temperature_c=space.base_temperature_c,
-                has_window=space.has_window,
-                connections=space.connections,
-                items=[ItemInfo(
-                    instance_id=item.instance_id,
-                    item_id=item.item_id,
-                    condition=item.condition,
-                    condition_value=item.condition_value,
-                    placed_in=item.placed_in,
-                    slot=item.slot,
-                    container=item.container,
-                    bulk=item.bulk,
-                ) for item in space_items],
+        if location not in spaces:
+            raise ValueError(f"Invalid location: {location} not found in spaces")
+
+        # Build all locations, then current location with items
+        all_locations: Optional[Mapping[str, LocationInfo]] = None
+        if include_all_locations:
+            # Group items in one pass instead of rescanning per space; field
+            # values are captured now, LocationInfo objects on first access
+            items_by_location = state.items_by_location()
+            captured = {
+                space_id: (
+                    _location_key(space, items_by_location.get(space_id, ())),
+                    space.connections,
+                )
+                for space_id, space in spaces.items()
+            }
+            # The current location is the same object as its all_locations entry
+            current_location = self._location_info_from_key(
+                spaces[location], captured[location][0]
+            )
+            all_locations = _LazyLocations(captured, {location: current_location})
+        else:
+            current_location = self._build_location_info(
+                spaces[location], state.get_items_at(location)
             )
 
         # Get recent events (last 10)
-        recent_events = [
-            EventInfo(event_id=event["event_id"], params=event.get("params", {}))
-            for event in list(self.state.event_log)[-10:]
-        ]
+        recent_events: Optional[List[EventInfo]] = None
+        if include_events:
+            recent_events = list(self._recent_event_infos(state.event_log))
 
         return GameStateSnapshot(
             world=world,
-            player_money_pence=self.state.player.money_pence,
-            utilities_paid=self.state.player.utilities_paid,
+            player_money_pence=player.money_pence,
+            utilities_paid=player.utilities_paid,
             needs=needs,
             traits=traits,
             utilities=utilities,
             skills=skills,
             aptitudes=aptitudes,
-            habit_tracker=dict(self.state.player.habit_tracker),
+            habit_tracker=(
+                dict(player.habit_tracker)
+                if snapshot_copy
+                else ReadOnlyView(player.habit_tracker)
+            ),
             current_location=current_location,
             all_locations=all_locations,
             recent_events=recent_events,
-            schema_version=self.state.schema_version,
+            schema_version=state.schema_version,
         )
 
-    def get_available_actions(self) -> AvailableActionsResponse:
+    def _recent_event_infos(self, event_log: EventLog) -> List[EventInfo]:
+        """EventInfo for the last 10 events, reused until the log changes.
+
+        Snapshots between actions see the same log, so the frozen EventInfo
+        objects are kept rather than rebuilt each time.
+        """
+        version = event_log.version
+        cached = self._recent_events_cache
+        if cached is None or cached[0] is not event_log or cached[1] != version:
+            infos = [
+                EventInfo(event["event_id"], event.get("params", EMPTY_MAPPING))
+                for event in event_log.recent(10)
+            ]
+            cached = (event_log, version, infos)
+            self._recent_events_cache = cached
+        return cached[2]
+
+    def _build_location_info(self, space: Space, items: Iterable[Item]) -> LocationInfo:
+        """Build LocationInfo for a space, reusing the last one if nothing changed.
+
+        The cache key is the space's fields plus every item's fields, read in
+        one attrgetter call per item. Spaces untouched since the last snapshot
+        skip all LocationInfo/ItemInfo construction, and their LocationInfo
+        objects are shared between snapshots.
+        """
+        return self._location_info_from_key(space, _location_key(space, items))
+
+    def _location_info_from_key(self, space: Space, key: _LocationKey) -> LocationInfo:
+        cached = self._location_cache.get(space.space_id)
+        if cached is not None and cached[0] == key and cached[1].connections is space.connections:
+            return cached[1]
+
+        info = _location_info(key, space.connections)
+        self._location_cache[space.space_id] = (key, info)
+        return info
+
+    def get_available_actions(
+        self, categories: Optional[AbstractSet[ActionCategory]] = None
+    ) -> AvailableActionsResponse:
         """Get all currently available actions with metadata.
 
+        Results are reused until the state's fingerprint changes, so both
+        executed actions and direct edits to the state are picked up.
+
+        Args:
+            categories: Only return actions in these categories. Listings for
+                other categories are skipped rather than built and dropped.
+
         Returns:
             AvailableActionsResponse with action metadata
         """
-        actions = [action for action in self._get_action_metadata_list() if action.available]
+        state = self.state
+        fingerprint = state.fingerprint()
+        cached = self._available_cache
+        fresh = cached is not None and cached[0] is state and cached[1] == fingerprint
+        if categories is None:
+            if not fresh:
+                cached = (state, fingerprint, list(self.iter_available_actions()))
+                self._available_cache = cached
+            actions = list(cached[2])
+        elif fresh:
+            actions = [a for a in cached[2] if a.category in categories]
+        else:
+            actions = list(self.iter_available_actions(categories))
 
         return AvailableActionsResponse(
             actions=actions,
-            location=self.state.world.location,
+            location=state.world.location,
             total_count=len(actions),
         )
 
+    def iter_available_actions(
+        self, categories: Optional[AbstractSet[ActionCategory]] = None
+    ) -> Iterator[ActionMetadata]:
+        """Yield currently available actions one at a time.
+
+        Metadata is built lazily, so callers that filter or stop early skip
+        the work for actions they never consume. Do not execute actions while
+        iterating.
+
+        Args:
+            categories: Only yield actions in these categories
+
+        Returns:
+            Iterator of ActionMetadata for each available action
+        """
+        return self._iter_catalog_action_metadata(available_only=True, categories=categories)
+
     def get_all_actions_metadata(self) -> List[ActionMetadata]:
         """Get metadata for all possible actions (even if not currently valid).
 
+        Cached against the state's fingerprint like get_available_actions.
+
         Returns:
             List of ActionMetadata for all actions
         """
         return self._get_action_metadata_list()
 
-    def validate_action(self, action_id: str, params: Optional[Dict[str, Any]] = None) -> ActionValidation:
+    def iter_all_actions_metadata(self) -> Iterator[ActionMetadata]:
+        """Yield metadata for all possible actions one at a time.
+
+        Like iter_available_actions, but locked actions are included. Each
+        card's preview is only computed when it is consumed, so callers that
+        page or filter skip the work for the rest. Do not execute actions
+        while iterating.
+
+        Returns:
+            Iterator of ActionMetadata for all actions
+        """
+        return self._iter_catalog_action_metadata()
+
+    def validate_action(
+        self,
+        action_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        include_preview: bool = False,
+    ) -> ActionValidation:
         """Validate if an action can be executed in the current state.
 
         Args:
             action_id: The action to validate
+            params: Optional action parameters (legacy ids are expanded when None)
+            include_preview: Attach an ActionPreview when the action is valid.
+                Previews sample the outcome roll, so availability checks
+                leave this off; see get_action_preview.
 
         Returns:
             ActionValidation with validation result
         """
-        action_call = ActionCall.from_legacy(action_id) if params is None else ActionCall(action_id, params)
+        action_call = _make_call(action_id, params)
         spec = self._action_specs.get(action_call.action_id)
         if spec is not None:
             ok, reason, missing = validate_action_spec(self.state, spec, self._item_meta, action_call.params)
             preview = None
-            if ok:
-                preview = ActionPreview(
-                    tier_distribution=preview_tier_distribution(
-                        self.state,
-                        spec,
-                        self._item_meta,
-                        rng_seed=1,
-                        samples=9,
-                    ),
-                    delta_ranges=preview_delta_ranges(spec),
-                    notes=build_preview_notes(self.state, spec, self._item_meta, action_call),
-                )
+            if ok and include_preview:
+                preview = self._build_preview(spec, action_call)
             return ActionValidation(
                 valid=ok,
                 action_id=action_id,
@@ -280,50 +516,95 @@ class RoomLifeAPI:
             reason="Unknown action (no spec found)",
         )
 
+    def get_action_preview(
+        self, action_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[ActionPreview]:
+        """Preview probable outcomes of an action, e.g. for hover/selection.
+
+        The preview is built whether or not the action is currently
+        available.
+
+        Args:
+            action_id: The action to preview
+            params: Optional action parameters (legacy ids are expanded when None)
+
+        Returns:
+            ActionPreview, or None if the action is unknown
+        """
+        action_call = _make_call(action_id, params)
+        spec = self._action_specs.get(action_call.action_id)
+        if spec is None:
+            return None
+        return self._build_preview(spec, action_call)
+
+    def _build_preview(self, spec: ActionSpec, action_call: ActionCall) -> ActionPreview:
+        # Cheap + deterministic previews
+        state = self.state
+        item_meta = self._item_meta
+        return ActionPreview(
+            tier_distribution=preview_tier_distribution(
+                state, spec, item_meta, rng_seed=1, samples=9
+            ),
+            delta_ranges=preview_delta_ranges(spec),
+            notes=build_preview_notes(state, spec, item_meta, action_call),
+        )
+
     def execute_action(
         self,
         action_id: str,
         rng_seed: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
+        *,
+        return_snapshot: bool = True,
     ) -> ActionResult:
         """Execute an action and return the result.
 
         Args:
             action_id: The action to execute
             rng_seed: Optional random seed for determinism
+            params: Optional action parameters
+            return_snapshot: When False and no state-change listeners are
+                subscribed, skip building the post-action snapshot and return
+                new_state=None (state_changes is still filled in)
 
         Returns:
             ActionResult with execution result and new state
         """
-        # Get snapshot before action
-        old_snapshot = self.get_state_snapshot()
-        old_event_count = len(self.state.event_log)
+        # Capture only the fields the diff reads; no snapshot before the action
+        old_diff = self._capture_diff_state()
+        # Sequence number rather than length: the log is bounded, so once it
+        # is full its length no longer grows
+        event_seq = self.state.event_log.appended
 
         # Apply action
         if rng_seed is None:
             rng_seed = 1
         apply_action(self.state, action_id, rng_seed, params=params)
 
-        # Get snapshot after action
-        new_snapshot = self.get_state_snapshot()
+        # Get snapshot after action, unless nobody will read it
+        new_snapshot: Optional[GameStateSnapshot] = None
+        if return_snapshot or self._state_change_listeners:
+            new_snapshot = self.get_state_snapshot()
+
+        # Check if action succeeded (look for failure events on the raw log entries)
+        raw_events = self.state.event_log.since(event_seq)
+        success = _FAILURE_EVENTS.isdisjoint(event["event_id"] for event in raw_events)
 
         # Get new events
         new_events = [
-            EventInfo(event_id=event["event_id"], params=event.get("params", {}))
-            for event in list(self.state.event_log)[old_event_count:]
+            EventInfo(event["event_id"], event.get("params", EMPTY_MAPPING))
+            for event in raw_events
         ]
 
         # Calculate state changes
-        state_changes = self._calculate_state_changes(old_snapshot, new_snapshot)
+        state_changes = self._calculate_state_changes(old_diff, self._capture_diff_state())
 
-        # Check if action succeeded (look for failure events)
-        failure_events = {"action.failed", "action.unknown", "bills.unpaid"}
-        success = not any(event.event_id in failure_events for event in new_events)
-
-        # Notify listeners
-        for event in new_events:
-            self._notify_event_listeners(event)
-        self._notify_state_change_listeners(new_snapshot)
+        # Notify listeners (no per-event calls when nobody is subscribed)
+        if self._event_listeners:
+            for event in new_events:
+                self._notify_event_listeners(event)
+        if new_snapshot is not None:
+            self._notify_state_change_listeners(new_snapshot)
 
         return ActionResult(
             success=success,
@@ -333,21 +614,27 @@ class RoomLifeAPI:
             state_changes=state_changes,
         )
 
-    def subscribe_to_events(self, callback: Callable[[EventInfo], None]) -> None:
+    def subscribe_to_events(self, callback: Callable[[EventInfo], None], safe: bool = True) -> None:
         """Subscribe to game events.
 
         Args:
             callback: Function to call when events occur
+            safe: Isolate the API from exceptions raised by the callback.
+                Trusted callbacks can pass False to be called directly.
         """
-        self._event_listeners.append(callback)
+        self._event_listeners += ((callback, safe),)
 
-    def subscribe_to_state_changes(self, callback: Callable[[GameStateSnapshot], None]) -> None:
+    def subscribe_to_state_changes(
+        self, callback: Callable[[GameStateSnapshot], None], safe: bool = True
+    ) -> None:
         """Subscribe to state changes.
 
         Args:
             callback: Function to call when state changes
+            safe: Isolate the API from exceptions raised by the callback.
+                Trusted callbacks can pass False to be called directly.
         """
-        self._state_change_listeners.append(callback)
+        self._state_change_listeners += ((callback, safe),)
 
     def unsubscribe_from_events(self, callback: Callable[[EventInfo], None]) -> None:
         """Unsubscribe from game events.
@@ -355,8 +642,7 @@ class RoomLifeAPI:
         Args:
             callback: The callback to remove
         """
-        if callback in self._event_listeners:
-            self._event_listeners.remove(callback)
+        self._event_listeners = _without_listener(self._event_listeners, callback)
 
     def unsubscribe_from_state_changes(self, callback: Callable[[GameStateSnapshot], None]) -> None:
         """Unsubscribe from state changes.
@@ -364,12 +650,14 @@ class RoomLifeAPI:
         Args:
             callback: The callback to remove
         """
-        if callback in self._state_change_listeners:
-            self._state_change_listeners.remove(callback)
+        self._state_change_listeners = _without_listener(self._state_change_listeners, callback)
 
     def _notify_event_listeners(self, event: EventInfo) -> None:
         """Notify all event listeners of a new event."""
-        for listener in self._event_listeners:
+        for listener, safe in self._event_listeners:
+            if not safe:
+                listener(event)
+                continue
             try:
                 listener(event)
             except Exception as e:
@@ -378,101 +666,146 @@ class RoomLifeAPI:
 
     def _notify_state_change_listeners(self, state: GameStateSnapshot) -> None:
         """Notify all state change listeners."""
-        for listener in self._state_change_listeners:
+        for listener, safe in self._state_change_listeners:
+            if not safe:
+                listener(state)
+                continue
             try:
                 listener(state)
             except Exception as e:
                 print(f"State change listener error: {e}")
 
+    def _capture_diff_state(self) -> _DiffState:
+        """Read the scalar fields _calculate_state_changes compares."""
+        state = self.state
+        player = state.player
+        world = state.world
+        return (
+            _read_needs(player.needs),
+            player.money_pence,
+            world.location,
+            world.day,
+            world.slice,
+        )
+
     def _calculate_state_changes(
-        self, old_state: GameStateSnapshot, new_state: GameStateSnapshot
+        self, old_diff: _DiffState, new_diff: _DiffState
     ) -> Dict[str, Any]:
-        """Calculate differences between two states."""
+        """Calculate differences between fields captured before and after an action."""
         changes: Dict[str, Any] = {}
+        old_needs, old_money, old_location, old_day, old_slice = old_diff
+        new_needs, new_money, new_location, new_day, new_slice = new_diff
 
         # Check needs changes
-        old_needs = old_state.needs.to_dict()
-        new_needs = new_state.needs.to_dict()
-        needs_changes = {k: new_needs[k] - old_needs[k] for k in old_needs if new_needs[k] != old_needs[k]}
+        needs_changes = _needs_delta(old_needs, new_needs)
         if needs_changes:
             changes["needs"] = needs_changes
 
         # Check money change
-        if old_state.player_money_pence != new_state.player_money_pence:
-            changes["money_pence"] = new_state.player_money_pence - old_state.player_money_pence
+        if old_money != new_money:
+            changes["money_pence"] = new_money - old_money
 
         # Check location change
-        if old_state.world.location != new_state.world.location:
+        if old_location != new_location:
             changes["location"] = {
-                "from": old_state.world.location,
-                "to": new_state.world.location,
+                "from": old_location,
+                "to": new_location,
             }
 
         # Check time change
-        if old_state.world.day != new_state.world.day or old_state.world.slice != new_state.world.slice:
+        if old_day != new_day or old_slice != new_slice:
             changes["time"] = {
-                "day": new_state.world.day,
-                "slice": new_state.world.slice,
+                "day": new_day,
+                "slice": new_slice,
             }
 
         return changes
 
     def _get_action_metadata_list(self) -> List[ActionMetadata]:
         """Get metadata for all possible actions."""
-        return self._get_catalog_action_metadata_list()
-
-    def _apply_availability_metadata(self, actions: List[ActionMetadata]) -> None:
-        for action in actions:
-            validation = self.validate_action(action.action_id, params=action.params)
-            action.available = validation.valid
-            action.why_locked = None if validation.valid else validation.reason
-            action.missing_requirements = validation.missing_requirements if not validation.valid else []
+        state = self.state
+        fingerprint = state.fingerprint()
+        cached = self._metadata_cache
+        if cached is None or cached[0] is not state or cached[1] != fingerprint:
+            cached = (state, fingerprint, self._get_catalog_action_metadata_list())
+            self._metadata_cache = cached
+        return list(cached[2])
 
     def _get_catalog_action_metadata_list(self) -> List[ActionMetadata]:
-        catalog = ActionCatalog(self._action_specs, self._item_meta)
-        cards = catalog.list_available(self.state)
-        actions: List[ActionMetadata] = []
-        for card in cards:
-            spec = self._action_specs.get(card.call.action_id)
-            category = ActionCategory.OTHER
-            if spec is not None:
-                category = self._get_action_category(spec.category)
+        return list(self.iter_all_actions_metadata())
+
+    def _iter_catalog_action_metadata(
+        self,
+        available_only: bool = False,
+        categories: Optional[AbstractSet[ActionCategory]] = None,
+    ) -> Iterator[ActionMetadata]:
+        action_ids = None
+        if categories is not None:
+            action_ids = frozenset(
+                action_id
+                for action_id, category in self._category_by_action.items()
+                if category in categories
+            )
+        # Attribute chains bound once; the loop body runs for every card
+        state = self.state
+        item_meta = self._item_meta
+        get_spec = self._action_specs.get
+        requirements_by_action = self._requirements_by_action
+        category_by_action = self._category_by_action
+        other = ActionCategory.OTHER
+        metadata_cls = ActionMetadata
+        # action_id -> (tier distribution, delta ranges). Neither depends on
+        # the call's params, so every card for an action (each shop item, job,
+        # ...) shares one read-only copy per pass instead of re-sampling
+        # compute_tier.
+        shared_previews: Dict[str, Tuple[Mapping[int, float], Mapping[str, Any]]] = {}
+        # One item scan serves both the listing and every preview's lookups
+        ctx = build_validation_context(state, item_meta)
+        for card in self._catalog.iter_available(state, available_only, action_ids, ctx):
+            if available_only and not card.available:
+                continue
+            call = card.call
+            action_id = call.action_id
+            spec = get_spec(action_id)
 
             # Generate preview for better player clarity
             preview = None
             if spec is not None:
                 # Cheap + deterministic previews
-                tier_dist = preview_tier_distribution(
-                    self.state, spec, self._item_meta, rng_seed=1, samples=9
-                )
-                delta_ranges = preview_delta_ranges(spec)
-                notes = build_preview_notes(self.state, spec, self._item_meta, card.call)
+                shared = shared_previews.get(action_id)
+                if shared is None:
+                    shared = (
+                        _read_only(
+                            preview_tier_distribution(
+                                state, spec, item_meta, rng_seed=1, samples=9, ctx=ctx
+                            )
+                        ),
+                        _read_only(preview_delta_ranges(spec)),
+                    )
+                    shared_previews[action_id] = shared
+                tier_dist, delta_ranges = shared
+                notes = build_preview_notes(state, spec, item_meta, call, ctx)
                 preview = ActionPreview(
                     tier_distribution=tier_dist,
                     delta_ranges=delta_ranges,
                     notes=notes,
                 )
 
-            actions.append(ActionMetadata(
-                action_id=card.call.action_id,
+            yield metadata_cls(
+                action_id=action_id,
                 display_name=card.display_name,
                 description=card.description,
-                category=category,
-                requirements=dict(spec.requires) if spec and spec.requires else {},
-                effects={},
-                params=card.call.params or None,
+                category=category_by_action.get(action_id, other),
+                requirements=requirements_by_action.get(action_id, EMPTY_MAPPING),
+                effects=EMPTY_MAPPING,
+                params=call.params or None,
                 available=card.available,
                 why_locked=card.why_locked,
                 missing_requirements=card.missing_requirements,
                 preview=preview,
-            ))
-        return actions
+            )
 
     def _get_action_category(self, value: Optional[str]) -> ActionCategory:
         if value is None:
             return ActionCategory.OTHER
-        normalized = value.strip().lower()
-        for category in ActionCategory:
-            if category.value == normalized:
-                return category
-        return ActionCategory.OTHER
+        return _CATEGORY_BY_VALUE.get(value.strip().lower(), ActionCategory.OTHER)
@@ -6,9 +6,85 @@ making it easy to integrate with various UI/UX engines.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, NoReturn, Optional
+
+
+class FrozenDict(dict):
+    """A dict that rejects in-place changes, for values shared between results.
+
+    Unlike MappingProxyType it still copies, pickles and passes through
+    dataclasses.asdict like a plain dict; copies are FrozenDicts too.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # The default dict reduction refills the copy through __setitem__
+        return type(self), (dict(self),)
+
+
+class ReadOnlyView(Mapping[str, Any]):
+    """A live read-only view of a dict, like MappingProxyType.
+
+    Copying, pickling or passing it through dataclasses.asdict detaches a
+    FrozenDict of the current contents instead of failing.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ReadOnlyView):
+            other = other._data
+        return self._data == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self._data),)
+
+
+# Shared read-only empty mapping for metadata fields that are usually empty
+EMPTY_MAPPING: Mapping[str, Any] = FrozenDict()
+
+
+def _copy_tree(value: Any) -> Any:
+    """Copy nested dicts and lists, sharing the immutable leaves.
+
+    Requirements and params are YAML/JSON trees of dicts, lists and scalars,
+    so this gives the same independence as deepcopy without its memo and
+    per-object dispatch.
+    """
+    if isinstance(value, Mapping):
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(item) for item in value]
+    return value
 
 
 class ActionCategory(str, Enum):
@@ -24,7 +100,7 @@ class ActionCategory(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NeedsSnapshot:
     """Current player needs (0-100 scale)."""
     hunger: int
@@ -39,10 +115,21 @@ class NeedsSnapshot:
     injury: int
 
     def to_dict(self) -> Dict[str, int]:
-        return asdict(self)
+        return {
+            "hunger": self.hunger,
+            "fatigue": self.fatigue,
+            "warmth": self.warmth,
+            "hygiene": self.hygiene,
+            "mood": self.mood,
+            "stress": self.stress,
+            "energy": self.energy,
+            "health": self.health,
+            "illness": self.illness,
+            "injury": self.injury,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillInfo:
     """Information about a specific skill."""
     name: str
@@ -53,10 +140,17 @@ class SkillInfo:
     aptitude_value: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "value": self.value,
+            "rust_rate": self.rust_rate,
+            "last_tick": self.last_tick,
+            "aptitude": self.aptitude,
+            "aptitude_value": self.aptitude_value,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TraitsSnapshot:
     """Current player traits (0-100 scale)."""
     discipline: int
@@ -70,10 +164,20 @@ class TraitsSnapshot:
     creativity: int
 
     def to_dict(self) -> Dict[str, int]:
-        return asdict(self)
+        return {
+            "discipline": self.discipline,
+            "confidence": self.confidence,
+            "empathy": self.empathy,
+            "fitness": self.fitness,
+            "charisma": self.charisma,
+            "frugality": self.frugality,
+            "curiosity": self.curiosity,
+            "stoicism": self.stoicism,
+            "creativity": self.creativity,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UtilitiesSnapshot:
     """Current utilities status."""
     power: bool
@@ -81,10 +185,10 @@ class UtilitiesSnapshot:
     water: bool
 
     def to_dict(self) -> Dict[str, bool]:
-        return asdict(self)
+        return {"power": self.power, "heat": self.heat, "water": self.water}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocationInfo:
     """Information about a location/space."""
     space_id: str
@@ -97,12 +201,17 @@ class LocationInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            **asdict(self),
+            "space_id": self.space_id,
+            "name": self.name,
+            "kind": self.kind,
+            "base_temperature_c": self.base_temperature_c,
+            "has_window": self.has_window,
+            "connections": list(self.connections),
             "items": [item.to_dict() for item in self.items],
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ItemInfo:
     """Information about an item."""
     instance_id: str
@@ -115,10 +224,19 @@ class ItemInfo:
     bulk: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "instance_id": self.instance_id,
+            "item_id": self.item_id,
+            "condition": self.condition,
+            "condition_value": self.condition_value,
+            "placed_in": self.placed_in,
+            "slot": self.slot,
+            "container": self.container,
+            "bulk": self.bulk,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorldInfo:
     """Current world/time state."""
     day: int
@@ -127,34 +245,46 @@ class WorldInfo:
     current_tick: int
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "day": self.day,
+            "slice": self.slice,
+            "location": self.location,
+            "current_tick": self.current_tick,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventInfo:
     """Information about a logged event."""
     event_id: str
-    params: Dict[str, Any]
+    params: Mapping[str, Any]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"event_id": self.event_id, "params": dict(self.params)}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameStateSnapshot:
-    """Complete snapshot of the game state for visualization."""
+    """Complete snapshot of the game state for visualization.
+
+    skills, all_locations and recent_events are None when the snapshot was
+    requested without those sections. all_locations is a read-only mapping
+    whose LocationInfo values may be built on first access. habit_tracker is a
+    read-only view of the live tracker unless the snapshot was taken with
+    snapshot_copy=True; call dict() on it to keep a detached copy.
+    """
     world: WorldInfo
     player_money_pence: int
     utilities_paid: bool
     needs: NeedsSnapshot
     traits: TraitsSnapshot
     utilities: UtilitiesSnapshot
-    skills: List[SkillInfo]
+    skills: Optional[List[SkillInfo]]
     aptitudes: Dict[str, float]
-    habit_tracker: Dict[str, int]
+    habit_tracker: Mapping[str, int]
     current_location: LocationInfo
-    all_locations: Dict[str, LocationInfo]
-    recent_events: List[EventInfo]
+    all_locations: Optional[Mapping[str, LocationInfo]]
+    recent_events: Optional[List[EventInfo]]
     schema_version: int
 
     def to_dict(self) -> Dict[str, Any]:
@@ -166,25 +296,35 @@ class GameStateSnapshot:
             "needs": self.needs.to_dict(),
             "traits": self.traits.to_dict(),
             "utilities": self.utilities.to_dict(),
-            "skills": [skill.to_dict() for skill in self.skills],
+            "skills": (
+                [skill.to_dict() for skill in self.skills] if self.skills is not None else None
+            ),
             "aptitudes": self.aptitudes,
-            "habit_tracker": self.habit_tracker,
+            "habit_tracker": dict(self.habit_tracker),
             "current_location": self.current_location.to_dict(),
-            "all_locations": {k: v.to_dict() for k, v in self.all_locations.items()},
-            "recent_events": [event.to_dict() for event in self.recent_events],
+            "all_locations": (
+                {k: v.to_dict() for k, v in self.all_locations.items()}
+                if self.all_locations is not None
+                else None
+            ),
+            "recent_events": (
+                [event.to_dict() for event in self.recent_events]
+                if self.recent_events is not None
+                else None
+            ),
             "schema_version": self.schema_version,
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionMetadata:
     """Metadata about an available action."""
     action_id: str
     display_name: str
     description: str
     category: ActionCategory
-    requirements: Dict[str, Any]
-    effects: Dict[str, str]
+    requirements: Mapping[str, Any]
+    effects: Mapping[str, str]
     cost_pence: Optional[int] = None
     requires_location: Optional[str] = None
     requires_utilities: Optional[List[str]] = None
@@ -196,13 +336,33 @@ class ActionMetadata:
     preview: Optional["ActionPreview"] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.preview is not None:
-            data["preview"] = self.preview.to_dict()
-        return data
+        # Built by hand: copies the shared mappings without asdict's deepcopy
+        return {
+            "action_id": self.action_id,
+            "display_name": self.display_name,
+            "description": self.description,
+            "category": self.category,
+            "requirements": _copy_tree(self.requirements),
+            "effects": dict(self.effects),
+            "cost_pence": self.cost_pence,
+            "requires_location": self.requires_location,
+            "requires_utilities": (
+                list(self.requires_utilities) if self.requires_utilities is not None else None
+            ),
+            "requires_items": (
+                list(self.requires_items) if self.requires_items is not None else None
+            ),
+            "params": _copy_tree(self.params),
+            "available": self.available,
+            "why_locked": self.why_locked,
+            "missing_requirements": (
+                list(self.missing_requirements) if self.missing_requirements is not None else None
+            ),
+            "preview": self.preview.to_dict() if self.preview is not None else None,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionValidation:
     """Result of action validation."""
     valid: bool
@@ -212,29 +372,42 @@ class ActionValidation:
     preview: Optional["ActionPreview"] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.preview is not None:
-            data["preview"] = self.preview.to_dict()
-        return data
+        return {
+            "valid": self.valid,
+            "action_id": self.action_id,
+            "reason": self.reason,
+            "missing_requirements": (
+                list(self.missing_requirements) if self.missing_requirements is not None else None
+            ),
+            "preview": self.preview.to_dict() if self.preview is not None else None,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionPreview:
     """Preview information for action outcomes."""
-    tier_distribution: Dict[int, float]
-    delta_ranges: Dict[str, Any]
+    tier_distribution: Mapping[int, float]
+    delta_ranges: Mapping[str, Any]
     notes: List[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "tier_distribution": dict(self.tier_distribution),
+            # {"needs": {need: {"min": int, "max": int}}}, copied two levels down
+            "delta_ranges": {
+                section: {key: dict(bounds) for key, bounds in ranges.items()}
+                for section, ranges in self.delta_ranges.items()
+            },
+            "notes": list(self.notes),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionResult:
     """Result of executing an action."""
     success: bool
     action_id: str
-    new_state: GameStateSnapshot
+    new_state: Optional[GameStateSnapshot]
     events_triggered: List[EventInfo]
     state_changes: Dict[str, Any]
 
@@ -242,13 +415,13 @@ class ActionResult:
         return {
             "success": self.success,
             "action_id": self.action_id,
-            "new_state": self.new_state.to_dict(),
+            "new_state": self.new_state.to_dict() if self.new_state is not None else None,
             "events_triggered": [event.to_dict() for event in self.events_triggered],
             "state_changes": self.state_changes,
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AvailableActionsResponse:
     """List of currently available actions."""
     actions: List[ActionMetadata]
@@ -1,15 +1,89 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from .action_call import ActionCall
-from .action_engine import validate_action_spec
+from .action_engine import (
+    ValidationContext,
+    build_validation_context,
+    compute_sell_price,
+    param_values_affect_validation,
+    validate_action_spec,
+)
+from .api_types import EMPTY_MAPPING
+from .constants import JOBS
 from .content_specs import ActionSpec, ItemMeta
-from .models import State
-
-
-@dataclass
+from .engine import (
+    _check_job_requirements,
+    _get_item_metadata,
+    _get_item_name,
+    _get_item_price,
+    _get_shop_catalog,
+    format_display_name,
+)
+from .models import Space, State
+
+
+@lru_cache(maxsize=1)
+def _purchase_templates() -> Tuple[Tuple[str, int, str, str], ...]:
+    """Shop entries as (item_id, price, display_name, description), built once.
+
+    The shop catalog and item metadata are static after load, so only
+    validation and affordability are computed per listing.
+    """
+    templates = []
+    for category in _get_shop_catalog().get("categories", []):
+        for item_id in category.get("items", []):
+            price = _get_item_price(item_id)
+            if price <= 0:
+                continue
+            item_name = _get_item_name(item_id)
+            description = _get_item_metadata(item_id).get("description", "")
+            templates.append((
+                item_id,
+                price,
+                f"Purchase {item_name}",
+                f"{description} (Cost: {price}p)",
+            ))
+    return tuple(templates)
+
+
+@lru_cache(maxsize=1)
+def _min_purchase_price() -> Optional[int]:
+    """Cheapest shop price, or None when nothing is for sale."""
+    return min((price for _, price, _, _ in _purchase_templates()), default=None)
+
+
+@lru_cache(maxsize=1)
+def _job_templates() -> Tuple[Tuple[str, str, str], ...]:
+    """Job listings as (job_id, display_name, description), built once.
+
+    JOBS is static, so only validation and the requirement check are
+    computed per listing.
+    """
+    return tuple(
+        (
+            job_id,
+            f"Apply for {job_data['name']}",
+            f"{job_data['description']} (Pay: {job_data['base_pay']}p)",
+        )
+        for job_id, job_data in JOBS.items()
+    )
+
+
+@dataclass(slots=True)
 class ActionCard:
     call: ActionCall
     display_name: str
@@ -23,60 +97,125 @@ class ActionCatalog:
     def __init__(self, specs: Dict[str, ActionSpec], item_meta: Dict[str, ItemMeta]):
         self.specs = specs
         self.item_meta = item_meta
+        # Parameterless actions listed on every pass; specs are static after
+        # load, so each one's call is built once too. The calls are handed out
+        # on every pass, so their params are the shared read-only mapping.
+        self._base_actions: Tuple[Tuple[str, ActionSpec, ActionCall], ...] = tuple(
+            (action_id, spec, ActionCall(action_id, EMPTY_MAPPING))
+            for action_id, spec in specs.items()
+            if self._is_listing_safe(spec)
+        )
+        # Actions whose listings differ only in plain string params (shop item,
+        # sold item, job); one validation result is shared per listing pass
+        self._param_free_actions: FrozenSet[str] = frozenset(
+            action_id
+            for action_id, spec in specs.items()
+            if not param_values_affect_validation(spec)
+        )
+        # space_id -> (connections list, ((target_space, display_name), ...))
+        self._move_targets: Dict[str, Tuple[List[str], Tuple[Tuple[str, str], ...]]] = {}
 
     def list_available(self, state: State) -> List[ActionCard]:
-        cards: List[ActionCard] = []
+        return list(self.iter_available(state))
 
-        for action_id, spec in self.specs.items():
-            if not self._is_listing_safe(spec):
+    def iter_available(
+        self,
+        state: State,
+        available_only: bool = False,
+        action_ids: Optional[AbstractSet[str]] = None,
+        ctx: Optional[ValidationContext] = None,
+    ) -> Iterator[ActionCard]:
+        """Yield action cards lazily, in list_available order.
+
+        Callers that stop early skip building the remaining cards. The state
+        must not be mutated while the iterator is in use.
+
+        With available_only, listings that are locked up front (such as
+        purchases the player cannot afford) are skipped before validation;
+        callers must still filter the remaining cards on ``available``.
+
+        With action_ids, only cards for those actions are built; listings
+        for other actions are skipped without being validated.
+
+        A ctx already built from this state by build_validation_context may be
+        passed in so callers can reuse its item lookups after the pass.
+        """
+        def wanted(action_id: str) -> bool:
+            return action_ids is None or action_id in action_ids
+
+        # Reachable-item scans are shared by every validation in this pass
+        if ctx is None:
+            ctx = build_validation_context(state, self.item_meta)
+
+        for action_id, spec, call in self._base_actions:
+            if not wanted(action_id):
                 continue
-            call = ActionCall(action_id, {})
-            ok, reason, missing = self._validate_call(state, call)
-            cards.append(
-                ActionCard(
-                    call=call,
-                    display_name=spec.display_name,
-                    description=spec.description,
-                    available=ok,
-                    why_locked=None if ok else reason,
-                    missing_requirements=missing,
-                )
+            ok, reason, missing = self._validate_call(state, call, ctx)
+            yield ActionCard(
+                call=call,
+                display_name=spec.display_name,
+                description=spec.description,
+                available=ok,
+                why_locked=None if ok else reason,
+                missing_requirements=missing,
             )
 
-        cards.extend(self._list_move_actions(state))
-        cards.extend(self._list_repair_actions(state))
-        cards.extend(self._list_pickup_actions(state))
-        cards.extend(self._list_drop_actions(state))
-        cards.extend(self._list_purchase_actions(state))
-        cards.extend(self._list_sell_actions(state))
-        cards.extend(self._list_discard_actions(state))
-        cards.extend(self._list_apply_job_actions(state))
-
-        return cards
+        if wanted("move"):
+            yield from self._list_move_actions(state, ctx)
+        want_repair = wanted("repair_item")
+        want_pickup = wanted("pick_up_item")
+        if want_repair or want_pickup:
+            repair_cards, pickup_cards = self._list_repair_and_pickup_actions(state, ctx)
+            if want_repair:
+                yield from repair_cards
+            if want_pickup:
+                yield from pickup_cards
+        if wanted("drop_item"):
+            yield from self._list_drop_actions(state, ctx)
+        if wanted("purchase_item"):
+            if not available_only:
+                yield from self._list_purchase_actions(state, ctx)
+            else:
+                min_price = _min_purchase_price()
+                if min_price is not None and state.player.money_pence >= min_price:
+                    yield from self._list_purchase_actions(state, ctx, affordable_only=True)
+        want_sell = wanted("sell_item")
+        want_discard = wanted("discard_item")
+        if want_sell or want_discard:
+            sell_cards, discard_cards = self._list_sell_and_discard_actions(state, ctx)
+            if want_sell:
+                yield from sell_cards
+            if want_discard:
+                yield from discard_cards
+        if wanted("apply_job"):
+            yield from self._list_apply_job_actions(state, ctx)
 
     def _is_listing_safe(self, spec: ActionSpec) -> bool:
         params = spec.parameters or []
         return not any(p.get("required") for p in params)
 
-    def _list_move_actions(self, state: State) -> List[ActionCard]:
+    def _list_move_actions(
+        self, state: State, ctx: Optional[ValidationContext] = None
+    ) -> List[ActionCard]:
         cards: List[ActionCard] = []
         spec = self.specs.get("move")
         if spec is None:
             return cards
 
-        current = state.world.location
-        if current not in state.spaces:
+        space = state.spaces.get(state.world.location)
+        if space is None:
             return cards
 
-        current_space = state.spaces[current]
-        for nxt in current_space.connections:
-            name = state.spaces[nxt].name if nxt in state.spaces else nxt
+        # Bound once; these loops run for every listed card
+        append = cards.append
+        validate_call = self._validate_call
+        for nxt, display_name in self._move_targets_for(state, space):
             call = ActionCall("move", {"target_space": nxt})
-            ok, reason, missing = self._validate_call(state, call)
-            cards.append(
+            ok, reason, missing = validate_call(state, call, ctx)
+            append(
                 ActionCard(
                     call=call,
-                    display_name=f"Move to {name}",
+                    display_name=display_name,
                     description=spec.description,
                     available=ok,
                     why_locked=None if ok else reason,
@@ -85,87 +224,110 @@ class ActionCatalog:
             )
         return cards
 
-    def _list_repair_actions(self, state: State) -> List[ActionCard]:
-        cards: List[ActionCard] = []
-        spec = self.specs.get("repair_item")
-        if spec is None:
-            return cards
-
-        items_here = state.get_items_at(state.world.location)
-        for item in items_here:
-            call = ActionCall(
-                "repair_item",
-                {"item_ref": {"mode": "instance_id", "instance_id": item.instance_id}},
-            )
-            ok, reason, missing = self._validate_call(state, call)
-            item_display_name = item.item_id.replace("_", " ").title()
-            cards.append(
-                ActionCard(
-                    call=call,
-                    display_name=f"Repair {item_display_name}",
-                    description=spec.description,
-                    available=ok,
-                    why_locked=None if ok else reason,
-                    missing_requirements=missing,
+    def _move_targets_for(self, state: State, space: Space) -> Tuple[Tuple[str, str], ...]:
+        """Return (target_space, display_name) pairs for moves out of a space.
+
+        Built once per space and reused while the space keeps the same
+        connections list, since topology and space names are static.
+        """
+        connections = space.connections
+        cached = self._move_targets.get(space.space_id)
+        if cached is not None and cached[0] is connections:
+            return cached[1]
+
+        get_space = state.spaces.get
+        targets = tuple(
+            (nxt, f"Move to {getattr(get_space(nxt), 'name', nxt)}")
+            for nxt in connections
+        )
+        self._move_targets[space.space_id] = (connections, targets)
+        return targets
+
+    def _list_repair_and_pickup_actions(
+        self, state: State, ctx: Optional[ValidationContext] = None
+    ) -> Tuple[List[ActionCard], List[ActionCard]]:
+        """Build repair and pickup cards in one pass over the location's items.
+
+        Returns (repair_cards, pickup_cards) so callers keep the order of all
+        repairs before all pickups.
+        """
+        repair_cards: List[ActionCard] = []
+        pickup_cards: List[ActionCard] = []
+        repair_spec = self.specs.get("repair_item")
+        pickup_spec = self.specs.get("pick_up_item")
+        if repair_spec is None and pickup_spec is None:
+            return repair_cards, pickup_cards
+
+        if ctx is None:
+            ctx = build_validation_context(state, self.item_meta)
+        append_repair = repair_cards.append
+        append_pickup = pickup_cards.append
+        validate_call = self._validate_call
+        get_meta = self.item_meta.get
+        for item in ctx.items_by_location.get(state.world.location, ()):
+            item_ref = {"mode": "instance_id", "instance_id": item.instance_id}
+
+            if repair_spec is not None:
+                call = ActionCall("repair_item", {"item_ref": item_ref})
+                ok, reason, missing = validate_call(state, call, ctx)
+                append_repair(
+                    ActionCard(
+                        call=call,
+                        display_name=f"Repair {format_display_name(item.item_id)}",
+                        description=repair_spec.description,
+                        available=ok,
+                        why_locked=None if ok else reason,
+                        missing_requirements=missing,
+                    )
                 )
-            )
-        return cards
 
-    def _list_pickup_actions(self, state: State) -> List[ActionCard]:
-        cards: List[ActionCard] = []
-        spec = self.specs.get("pick_up_item")
-        if spec is None:
-            return cards
+            if pickup_spec is not None:
+                # Each call gets its own params, as with separate listings
+                call = ActionCall("pick_up_item", {"item_ref": dict(item_ref)})
+                ok, reason, missing = validate_call(state, call, ctx)
 
-        here = state.world.location
-        for item in state.items:
-            if item.placed_in != here:
-                continue
-
-            call = ActionCall(
-                "pick_up_item",
-                {"item_ref": {"mode": "instance_id", "instance_id": item.instance_id}},
-            )
-            ok, reason, missing = self._validate_call(state, call)
-
-            # Use item_meta for nicer names if available
-            meta = self.item_meta.get(item.item_id)
-            item_name = meta.name if meta else item.item_id.replace("_", " ").title()
+                # Use item_meta for nicer names if available
+                meta = get_meta(item.item_id)
+                item_name = meta.name if meta else format_display_name(item.item_id)
 
-            cards.append(
-                ActionCard(
-                    call=call,
-                    display_name=f"Pick up {item_name}",
-                    description=spec.description,
-                    available=ok,
-                    why_locked=None if ok else reason,
-                    missing_requirements=missing,
+                append_pickup(
+                    ActionCard(
+                        call=call,
+                        display_name=f"Pick up {item_name}",
+                        description=pickup_spec.description,
+                        available=ok,
+                        why_locked=None if ok else reason,
+                        missing_requirements=missing,
+                    )
                 )
-            )
 
-        return cards
+        return repair_cards, pickup_cards
 
-    def _list_drop_actions(self, state: State) -> List[ActionCard]:
+    def _list_drop_actions(
+        self, state: State, ctx: Optional[ValidationContext] = None
+    ) -> List[ActionCard]:
         cards: List[ActionCard] = []
         spec = self.specs.get("drop_item")
         if spec is None:
             return cards
 
-        for item in state.items:
-            if item.placed_in != "inventory":
-                continue
-
+        if ctx is None:
+            ctx = build_validation_context(state, self.item_meta)
+        append = cards.append
+        validate_call = self._validate_call
+        get_meta = self.item_meta.get
+        for item in ctx.items_by_location.get("inventory", ()):
             call = ActionCall(
                 "drop_item",
                 {"item_ref": {"mode": "instance_id", "instance_id": item.instance_id}},
             )
-            ok, reason, missing = self._validate_call(state, call)
+            ok, reason, missing = validate_call(state, call, ctx)
 
             # Use item_meta for nicer names if available
-            meta = self.item_meta.get(item.item_id)
-            item_name = meta.name if meta else item.item_id.replace("_", " ").title()
+            meta = get_meta(item.item_id)
+            item_name = meta.name if meta else format_display_name(item.item_id)
 
-            cards.append(
+            append(
                 ActionCard(
                     call=call,
                     display_name=f"Drop {item_name}",
@@ -182,104 +344,67 @@ class ActionCatalog:
         self,
         state: State,
         call: ActionCall,
+        ctx: Optional[ValidationContext] = None,
     ) -> Tuple[bool, str, List[str]]:
         spec = self.specs.get(call.action_id)
         if spec is None:
             return False, "Unknown action", ["unknown action"]
-        return validate_action_spec(state, spec, self.item_meta, call.params)
-
-    def _list_purchase_actions(self, state: State) -> List[ActionCard]:
-        from .engine import _get_shop_catalog, _get_item_metadata
+        return validate_action_spec(state, spec, self.item_meta, call.params, ctx)
 
-        cards: List[ActionCard] = []
-        spec = self.specs.get("purchase_item")
-        if spec is None:
-            return cards
-
-        # Get purchasable items from shop catalog
-        catalog = _get_shop_catalog()
-        for category in catalog.get("categories", []):
-            for item_id in category.get("items", []):
-                metadata = _get_item_metadata(item_id)
-                price = metadata.get("price", 0)
-
-                if price <= 0:
-                    continue
+    def _listing_validator(
+        self,
+        state: State,
+        action_id: str,
+        ctx: Optional[ValidationContext] = None,
+    ) -> Callable[[ActionCall], Tuple[bool, str, List[str]]]:
+        """Return a validate function for one listing pass over action_id.
 
-                call = ActionCall("purchase_item", {"item_id": item_id})
-                ok, reason, missing = self._validate_call(state, call)
+        For param-free actions the first result is reused for the rest of
+        the pass, with a fresh missing list per card.
+        """
+        if action_id not in self._param_free_actions:
+            return lambda call: self._validate_call(state, call, ctx)
 
-                # Check if player has enough money
-                if state.player.money_pence < price:
-                    ok = False
-                    missing.append(f"need {price}p (have {state.player.money_pence}p)")
+        shared: List[Tuple[bool, str, List[str]]] = []
 
-                item_name = metadata.get("name", item_id)
-                description = metadata.get("description", "")
+        def validate(call: ActionCall) -> Tuple[bool, str, List[str]]:
+            if not shared:
+                shared.append(self._validate_call(state, call, ctx))
+            ok, reason, missing = shared[0]
+            return ok, reason, list(missing)
 
-                cards.append(
-                    ActionCard(
-                        call=call,
-                        display_name=f"Purchase {item_name}",
-                        description=f"{description} (Cost: {price}p)",
-                        available=ok,
-                        why_locked=None if ok else reason,
-                        missing_requirements=missing,
-                    )
-                )
-
-        return cards
-
-    def _list_sell_actions(self, state: State) -> List[ActionCard]:
-        from .engine import _get_item_metadata
+        return validate
 
+    def _list_purchase_actions(
+        self,
+        state: State,
+        ctx: Optional[ValidationContext] = None,
+        affordable_only: bool = False,
+    ) -> List[ActionCard]:
         cards: List[ActionCard] = []
-        spec = self.specs.get("sell_item")
+        spec = self.specs.get("purchase_item")
         if spec is None:
             return cards
 
-        # List items in inventory or at current location that can be sold
-        current_location = state.world.location
-        items_here = [
-            item
-            for item in state.items
-            if item.placed_in == "inventory" or item.placed_in == current_location
-        ]
-        seen_item_ids = set()
-
-        # NOTE: Only one action per item_id is shown, even if multiple instances exist.
-        # The first instance encountered is used for price/condition display, and will be
-        # the one sold when the action is executed. This matches legacy behavior but means
-        # players cannot choose which instance to sell if they have duplicates.
-        # Future enhancement: allow instance-level selection for items with same item_id.
-        for item in items_here:
-            # Only list each item_id once
-            if item.item_id in seen_item_ids:
-                continue
-
-            metadata = _get_item_metadata(item.item_id)
-            base_price = metadata.get("price", 0)
-
-            if base_price <= 0:
+        money = state.player.money_pence
+        validate = self._listing_validator(state, "purchase_item", ctx)
+        append = cards.append
+        for item_id, price, display_name, description in _purchase_templates():
+            if affordable_only and money < price:
                 continue
+            call = ActionCall("purchase_item", {"item_id": item_id})
+            ok, reason, missing = validate(call)
 
-            seen_item_ids.add(item.item_id)
-
-            # Calculate sell price
-            condition_multiplier = item.condition_value / 100.0
-            sell_price = int(base_price * 0.4 * condition_multiplier)
-            sell_price = max(100, sell_price)
-
-            call = ActionCall("sell_item", {"item_id": item.item_id})
-            ok, reason, missing = self._validate_call(state, call)
-
-            item_name = metadata.get("name", item.item_id)
+            # Check if player has enough money
+            if money < price:
+                ok = False
+                missing.append(f"need {price}p (have {money}p)")
 
-            cards.append(
+            append(
                 ActionCard(
                     call=call,
-                    display_name=f"Sell {item_name}",
-                    description=f"Sell for ~{sell_price}p (condition: {item.condition})",
+                    display_name=display_name,
+                    description=description,
                     available=ok,
                     why_locked=None if ok else reason,
                     missing_requirements=missing,
@@ -288,71 +413,98 @@ class ActionCatalog:
 
         return cards
 
-    def _list_discard_actions(self, state: State) -> List[ActionCard]:
-        from .engine import _get_item_metadata
-
-        cards: List[ActionCard] = []
-        spec = self.specs.get("discard_item")
-        if spec is None:
-            return cards
+    def _list_sell_and_discard_actions(
+        self, state: State, ctx: Optional[ValidationContext] = None
+    ) -> Tuple[List[ActionCard], List[ActionCard]]:
+        """Build sell and discard cards in one pass over reachable item ids.
+
+        Both listings cover the same items, so each item's name is looked up
+        once. Returns (sell_cards, discard_cards) so callers keep the order of
+        all sells before all discards.
+        """
+        sell_cards: List[ActionCard] = []
+        discard_cards: List[ActionCard] = []
+        sell_spec = self.specs.get("sell_item")
+        discard_spec = self.specs.get("discard_item")
+        if sell_spec is None and discard_spec is None:
+            return sell_cards, discard_cards
 
         # List items in inventory or at current location
-        current_location = state.world.location
-        items_here = [
-            item
-            for item in state.items
-            if item.placed_in == "inventory" or item.placed_in == current_location
-        ]
-        seen_item_ids = set()
+        if ctx is None:
+            ctx = build_validation_context(state, self.item_meta)
+        validate_sell = self._listing_validator(state, "sell_item", ctx)
+        validate_discard = self._listing_validator(state, "discard_item", ctx)
+        append_sell = sell_cards.append
+        append_discard = discard_cards.append
 
         # NOTE: Only one action per item_id is shown, even if multiple instances exist.
-        # The first instance encountered will be discarded. This matches legacy behavior.
+        # The first instance encountered is used for price/condition display, and will be
+        # the one sold or discarded when the action is executed. This matches legacy
+        # behavior but means players cannot choose which instance to act on if they have
+        # duplicates.
         # Future enhancement: allow instance-level selection for items with same item_id.
-        for item in items_here:
-            # Only list each item_id once
-            if item.item_id in seen_item_ids:
-                continue
-
-            seen_item_ids.add(item.item_id)
-
-            metadata = _get_item_metadata(item.item_id)
-            item_name = metadata.get("name", item.item_id.replace("_", " ").title())
-
-            call = ActionCall("discard_item", {"item_id": item.item_id})
-            ok, reason, missing = self._validate_call(state, call)
-
-            cards.append(
-                ActionCard(
-                    call=call,
-                    display_name=f"Discard {item_name}",
-                    description="Throw away this item permanently",
-                    available=ok,
-                    why_locked=None if ok else reason,
-                    missing_requirements=missing,
+        for item_id, item in ctx.first_reachable.items():
+            item_name = _get_item_name(item_id)
+
+            base_price = _get_item_price(item_id) if sell_spec is not None else 0
+            if base_price > 0:
+                sell_price = compute_sell_price(base_price, item.condition_value)
+                call = ActionCall("sell_item", {"item_id": item_id})
+                ok, reason, missing = validate_sell(call)
+                append_sell(
+                    ActionCard(
+                        call=call,
+                        display_name=f"Sell {item_name}",
+                        description=f"Sell for ~{sell_price}p (condition: {item.condition})",
+                        available=ok,
+                        why_locked=None if ok else reason,
+                        missing_requirements=missing,
+                    )
                 )
-            )
 
-        return cards
+            if discard_spec is not None:
+                call = ActionCall("discard_item", {"item_id": item_id})
+                ok, reason, missing = validate_discard(call)
+                append_discard(
+                    ActionCard(
+                        call=call,
+                        display_name=f"Discard {item_name}",
+                        description="Throw away this item permanently",
+                        available=ok,
+                        why_locked=None if ok else reason,
+                        missing_requirements=missing,
+                    )
+                )
 
-    def _list_apply_job_actions(self, state: State) -> List[ActionCard]:
-        from .constants import JOBS
+        return sell_cards, discard_cards
 
+    def _list_apply_job_actions(
+        self, state: State, ctx: Optional[ValidationContext] = None
+    ) -> List[ActionCard]:
         cards: List[ActionCard] = []
         spec = self.specs.get("apply_job")
         if spec is None:
             return cards
 
-        for job_id, job_data in JOBS.items():
+        validate = self._listing_validator(state, "apply_job", ctx)
+        current_job = state.player.current_job
+        # Item requirements of every job are checked against the same items
+        location = state.world.location
+        items_here = (
+            ctx.items_by_location.get(location, [])
+            if ctx is not None
+            else state.get_items_at(location)
+        )
+        for job_id, display_name, description in _job_templates():
             # Don't show current job
-            if state.player.current_job == job_id:
+            if current_job == job_id:
                 continue
 
             call = ActionCall("apply_job", {"job_id": job_id})
-            ok, reason, missing = self._validate_call(state, call)
+            ok, reason, missing = validate(call)
 
             # Check job requirements
-            from .engine import _check_job_requirements
-            meets_req, req_reason = _check_job_requirements(state, job_id)
+            meets_req, req_reason = _check_job_requirements(state, job_id, items_here)
             if not meets_req:
                 ok = False
                 missing.append(req_reason)
@@ -360,8 +512,8 @@ class ActionCatalog:
             cards.append(
                 ActionCard(
                     call=call,
-                    display_name=f"Apply for {job_data['name']}",
-                    description=f"{job_data['description']} (Pay: {job_data['base_pay']}p)",
+                    display_name=display_name,
+                    description=description,
                     available=ok,
                     why_locked=None if ok else reason,
                     missing_requirements=missing,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 # Time slices in a day
 TIME_SLICES = ["morning", "afternoon", "evening", "night"]
+# Time slice name -> position within the day (dict lookup instead of list.index)
+TIME_SLICE_INDEX = {name: i for i, name in enumerate(TIME_SLICES)}
 
 # All skill names in the system
 SKILL_NAMES = [
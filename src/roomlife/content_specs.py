@@ -8,6 +8,7 @@ This module provides data structures and loaders for:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
@@ -122,7 +123,8 @@ def load_actions(path: str | Path) -> Dict[str, ActionSpec]:
         line = _get_action_line(a, line_map, index_lines, idx)
         _validate_action_dict(a, file_path, line)
 
-        action_id = a["id"]
+        # Interned so lookups from interned call sites hit the identity fast path
+        action_id = sys.intern(a["id"])
         if action_id in seen:
             first_line = seen[action_id]
             this_line = line if line is not None else "?"
@@ -134,10 +136,10 @@ def load_actions(path: str | Path) -> Dict[str, ActionSpec]:
         seen[action_id] = line if line is not None else -1
 
         out[action_id] = ActionSpec(
-            id=a["id"],
+            id=action_id,
             display_name=a.get("display_name", a["id"]),
             description=a.get("description", ""),
-            category=a.get("category", "other"),
+            category=sys.intern(a.get("category", "other")),
             time_minutes=int(a.get("time_minutes", 0)),
             requires=a.get("requires", {}),
             modifiers=a.get("modifiers", {}),
@@ -300,13 +302,16 @@ def load_spaces(path: str | Path) -> Dict[str, SpaceSpec]:
             raise ValueError(f"{file_path}: spaces[{idx}] must be a mapping")
         if not s.get("id"):
             raise ValueError(f"{file_path}: spaces[{idx}] missing id")
-        out[s["id"]] = SpaceSpec(
-            id=s["id"],
+        # Space ids key state.spaces and are compared against every item's
+        # placed_in, so they are interned like action and item ids
+        space_id = sys.intern(s["id"])
+        out[space_id] = SpaceSpec(
+            id=space_id,
             name=s["name"],
             kind=s["kind"],
             base_temperature_c=s["base_temperature_c"],
             has_window=s["has_window"],
-            connections=s.get("connections", []),
+            connections=[sys.intern(c) for c in s.get("connections", [])],
             tags=s.get("tags", []),
             fixtures=s.get("fixtures", []),
             utilities_available=s.get("utilities_available", []),
@@ -344,9 +349,11 @@ def load_item_meta(path: str | Path) -> Dict[str, ItemMeta]:
             raise ValueError(f"{file_path}: items[{idx}] must be a mapping")
         if not it.get("id"):
             raise ValueError(f"{file_path}: items[{idx}] missing id")
-        out[it["id"]] = ItemMeta(
-            id=it["id"],
-            name=it.get("name", it["id"]),
+        # Interned like action ids: legacy ids resolve to interned suffixes
+        item_id = sys.intern(it["id"])
+        out[item_id] = ItemMeta(
+            id=item_id,
+            name=it.get("name", item_id),
             tags=it.get("tags", []),
             provides=it.get("provides", []),
             requires_utilities=it.get("requires_utilities", []),
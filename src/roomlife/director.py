@@ -12,6 +12,7 @@ import random
 import zlib
 from typing import Any, Dict, List
 
+from .action_call import ActionCall
 from .action_engine import build_preview_notes, preview_tier_distribution, validate_action_spec
 from .constants import MAX_EVENT_LOG
 from .models import State
@@ -191,7 +192,6 @@ def seed_daily_goals(
         tier_dist = preview_tier_distribution(state, chosen_spec, item_meta, rng_seed=tier_seed, samples=9)
 
         # Generate preview notes (use empty ActionCall since we don't have params yet)
-        from .action_call import ActionCall
         dummy_call = ActionCall(chosen_action_id, {})
         notes = build_preview_notes(state, chosen_spec, item_meta, dummy_call)
 
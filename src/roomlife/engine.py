@@ -4,8 +4,9 @@ import logging
 import random
 import yaml
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .constants import (
     DOCTOR_ILLNESS_RECOVERY,
@@ -22,6 +23,7 @@ from .constants import (
     REST_INJURY_RECOVERY,
     SKILL_NAMES,
     SKILL_TO_APTITUDE,
+    TIME_SLICE_INDEX,
     TIME_SLICES,
     TRAIT_DRIFT_CONFIGS,
     TRAIT_DRIFT_THRESHOLD,
@@ -81,6 +83,8 @@ def _load_item_tags() -> Dict[str, set]:
 # Cache item tags to avoid reloading YAML repeatedly
 _ITEM_TAGS_CACHE = None
 _ITEM_METADATA_CACHE = None
+_ITEM_PRICES_CACHE = None
+_ITEM_NAMES_CACHE = None
 _SHOP_CATALOG_CACHE = None
 
 # Data-driven action system caches
@@ -129,13 +133,55 @@ def _get_item_metadata(item_id: str) -> dict:
     global _ITEM_METADATA_CACHE
     if _ITEM_METADATA_CACHE is None:
         _ITEM_METADATA_CACHE = _load_item_metadata()
-    return _ITEM_METADATA_CACHE.get(item_id, {
-        "name": item_id,
-        "price": 0,
-        "quality": 1.0,
-        "description": "",
-        "tags": set(),
-    })
+    metadata = _ITEM_METADATA_CACHE.get(item_id)
+    if metadata is None:
+        # Unknown ids come straight from client params, so their defaults are
+        # built per miss rather than cached without bound
+        metadata = {
+            "name": item_id,
+            "price": 0,
+            "quality": 1.0,
+            "description": "",
+            "tags": set(),
+        }
+    return metadata
+
+
+def _build_item_columns() -> None:
+    """Split item metadata into flat per-field lookups (price, name).
+
+    Hot listing paths read one field per item, so they use these columns
+    instead of fetching the full metadata dict and calling .get on it.
+    """
+    global _ITEM_METADATA_CACHE, _ITEM_PRICES_CACHE, _ITEM_NAMES_CACHE
+    if _ITEM_METADATA_CACHE is None:
+        # Load metadata here so the columns come from the same parse
+        _ITEM_METADATA_CACHE = _load_item_metadata()
+    _ITEM_PRICES_CACHE = {}
+    _ITEM_NAMES_CACHE = {}
+    for iid, meta in _ITEM_METADATA_CACHE.items():
+        _ITEM_PRICES_CACHE[iid] = meta.get("price", 0)
+        _ITEM_NAMES_CACHE[iid] = meta.get("name", iid)
+
+
+def _get_item_price(item_id: str) -> int:
+    """Get the base price of an item (0 if not for sale) without building a metadata dict."""
+    if _ITEM_PRICES_CACHE is None:
+        _build_item_columns()
+    return _ITEM_PRICES_CACHE.get(item_id, 0)
+
+
+def _get_item_name(item_id: str) -> str:
+    """Get the display name of an item (its id if unknown)."""
+    if _ITEM_NAMES_CACHE is None:
+        _build_item_columns()
+    return _ITEM_NAMES_CACHE.get(item_id, item_id)
+
+
+@lru_cache(maxsize=1024)
+def format_display_name(name: str) -> str:
+    """Title-case an identifier for display (e.g. "desk_lamp" -> "Desk Lamp")."""
+    return name.replace("_", " ").title()
 
 
 def _load_shop_catalog() -> dict:
@@ -162,8 +208,12 @@ def _find_item_with_tag(state: State, tag: str, location: str = None) -> Item |
     if location is None:
         location = state.world.location
 
-    items_here = state.get_items_at(location)
-    for item in items_here:
+    return _first_item_with_tag(state.get_items_at(location), tag)
+
+
+def _first_item_with_tag(items: Iterable[Item], tag: str) -> Item | None:
+    """First item in items whose item_id carries tag."""
+    for item in items:
         if tag in _get_item_tags(item.item_id):
             return item
     return None
@@ -213,9 +263,17 @@ def _get_health_penalty(state: State) -> float:
     return 0.5 + (health / HEALTH_PENALTY_THRESHOLD) * 0.5
 
 
-def _check_job_requirements(state: State, job_id: str) -> Tuple[bool, str]:
+def _check_job_requirements(
+    state: State, job_id: str, items_here: Optional[List[Item]] = None
+) -> Tuple[bool, str]:
     """Check if player meets job requirements.
 
+    Args:
+        state: Game state
+        job_id: Job identifier
+        items_here: Items at the current location, when the caller already has
+            them (e.g. while listing every job); scanned from state otherwise
+
     Returns:
         Tuple of (meets_requirements, reason_if_failed)
     """
@@ -230,6 +288,8 @@ def _check_job_requirements(state: State, job_id: str) -> Tuple[bool, str]:
         return True, ""
 
     require_all = requirements.get("require_all", True)
+    skills = state.player.skills_detailed
+    traits = state.player.traits
 
     # Check skill requirements
     skill_reqs = requirements.get("skills", [])
@@ -237,8 +297,7 @@ def _check_job_requirements(state: State, job_id: str) -> Tuple[bool, str]:
     for skill_req in skill_reqs:
         skill_name = skill_req["name"]
         min_value = skill_req["min"]
-        skill = _get_skill(state, skill_name)
-        if skill.value < min_value:
+        if skills[skill_name].value < min_value:
             skill_met = False
             if require_all:
                 return False, f"insufficient_{skill_name}"
@@ -249,7 +308,7 @@ def _check_job_requirements(state: State, job_id: str) -> Tuple[bool, str]:
     for trait_req in trait_reqs:
         trait_name = trait_req["name"]
         min_value = trait_req["min"]
-        trait_value = getattr(state.player.traits, trait_name, 0)
+        trait_value = getattr(traits, trait_name, 0)
         if trait_value < min_value:
             trait_met = False
             if require_all:
@@ -258,9 +317,11 @@ def _check_job_requirements(state: State, job_id: str) -> Tuple[bool, str]:
     # Check item requirements (e.g., certification, laptop)
     item_reqs = requirements.get("items", [])
     item_met = True
+    if item_reqs and items_here is None:
+        items_here = state.get_items_at(state.world.location)
     for item_req in item_reqs:
         tag = item_req["tag"]
-        has_item = _find_item_with_tag(state, tag) is not None
+        has_item = _first_item_with_tag(items_here, tag) is not None
         if not has_item:
             item_met = False
             if require_all:
@@ -337,9 +398,8 @@ def _apply_trait_drift(state: State) -> List[str]:
 
 
 def _calculate_current_tick(state: State) -> int:
-    try:
-        slice_index = TIME_SLICES.index(state.world.slice)
-    except ValueError:
+    slice_index = TIME_SLICE_INDEX.get(state.world.slice)
+    if slice_index is None:
         # Invalid slice, default to 0 (morning)
         logger.warning(f"Invalid time slice '{state.world.slice}' in _calculate_current_tick, using 0")
         slice_index = 0
@@ -551,9 +611,8 @@ def new_game(seed: Optional[int] = None) -> State:
 
 
 def _advance_time(state: State) -> None:
-    try:
-        idx = TIME_SLICES.index(state.world.slice)
-    except ValueError:
+    idx = TIME_SLICE_INDEX.get(state.world.slice)
+    if idx is None:
         # If current slice is invalid, reset to first slice
         logger.warning(f"Invalid time slice '{state.world.slice}', resetting to '{TIME_SLICES[0]}'")
         state.world.slice = TIME_SLICES[0]
@@ -699,9 +758,9 @@ def apply_action(
     rng_seed: int = 1,
     params: Optional[Dict[str, object]] = None,
 ) -> None:
-    try:
-        time_slice_index = TIME_SLICES.index(state.world.slice)
-    except ValueError:
+    state.touch()
+    time_slice_index = TIME_SLICE_INDEX.get(state.world.slice)
+    if time_slice_index is None:
         # If current slice is invalid, use 0 as fallback
         logger.warning(f"Invalid time slice '{state.world.slice}' in apply_action, using 0")
         time_slice_index = 0
@@ -756,9 +815,9 @@ def generate_skill_recap(state: State) -> List[Dict]:
             aptitude_name = SKILL_TO_APTITUDE[skill_name]
             aptitude_value = getattr(state.player.aptitudes, aptitude_name)
             recap.append({
-                "skill": skill_name.replace("_", " ").title(),
+                "skill": format_display_name(skill_name),
                 "value": round(skill.value, 2),
-                "aptitude": aptitude_name.replace("_", " ").title(),
+                "aptitude": format_display_name(aptitude_name),
                 "aptitude_value": round(aptitude_value, 3),
             })
     return recap
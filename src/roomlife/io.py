@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import asdict
 from pathlib import Path
 from typing import Dict
@@ -25,6 +26,9 @@ from .models import (
     generate_instance_id,
 )
 
+# Item fields whose values repeat across items (ids, locations, slots, conditions)
+_ITEM_SHARED_STRINGS = ("item_id", "placed_in", "slot", "condition")
+
 
 def save_state(state: State, path: Path) -> None:
     """Save game state to YAML file, excluding non-serializable fields."""
@@ -37,6 +41,9 @@ def save_state(state: State, path: Path) -> None:
     if "world" in state_dict and "rng" in state_dict["world"]:
         del state_dict["world"]["rng"]
 
+    # Revision is an in-memory cache key, not game data
+    state_dict.pop("revision", None)
+
     # Convert deque to list for serialization
     if "event_log" in state_dict:
         state_dict["event_log"] = list(state_dict["event_log"])
@@ -126,6 +133,12 @@ def load_state(path: Path) -> State:
         item_data.setdefault("bulk", 1)
         item_data.setdefault("quality", 1.0)
         item_data.setdefault("slot", "floor")
+        # Loaded strings are fresh copies; intern the ones shared by many
+        # items so they match the interned ids used as lookup keys
+        for key in _ITEM_SHARED_STRINGS:
+            value = item_data.get(key)
+            if isinstance(value, str):
+                item_data[key] = sys.intern(value)
         items.append(Item(**item_data))
     s.items = items
 
@@ -2,21 +2,106 @@ from __future__ import annotations
 
 import random
 from collections import deque
-from dataclasses import dataclass, field
-from typing import Any, Deque, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from .constants import MAX_EVENT_LOG, SKILL_NAMES
+from .constants import MAX_EVENT_LOG, SKILL_NAMES, TIME_SLICE_INDEX
+
+
+def _bumps_version(method):
+    """Wrap a deque method so EventLog.version changes when it succeeds."""
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self.version += 1
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
 
 
 class EventLog(deque):
-    """Deque with slice support for recent event queries."""
+    """Deque with slice support for recent event queries.
+
+    appended counts every event ever added through append/extend/+= (including
+    the initial contents), so it keeps increasing after maxlen starts
+    evicting old entries. Callers remember it as a sequence number and pass
+    it to since() to get exactly the events added afterwards. The log is
+    append-only: appendleft, extendleft, insert and *= raise TypeError, since
+    events added anywhere but the end would not be counted in order.
+
+    version changes on every edit, including pop, remove and item
+    assignment, so (log, version) identifies the current contents for caches.
+    """
+
+    __slots__ = ("appended", "version")
+
+    def __init__(self, iterable=(), maxlen=None):
+        super().__init__(iterable, maxlen)
+        self.appended = len(self)
+        self.version = 0
+
+    def append(self, event) -> None:  # type: ignore[override]
+        super().append(event)
+        self.appended += 1
+        self.version += 1
+
+    def extend(self, events) -> None:  # type: ignore[override]
+        events = list(events)
+        super().extend(events)
+        self.appended += len(events)
+        self.version += 1
+
+    pop = _bumps_version(deque.pop)
+    popleft = _bumps_version(deque.popleft)
+    remove = _bumps_version(deque.remove)
+    clear = _bumps_version(deque.clear)
+    reverse = _bumps_version(deque.reverse)
+    rotate = _bumps_version(deque.rotate)
+    __setitem__ = _bumps_version(deque.__setitem__)
+    __delitem__ = _bumps_version(deque.__delitem__)
+
+    def __iadd__(self, events) -> "EventLog":
+        # deque.__iadd__ extends in C without going through extend()
+        self.extend(events)
+        return self
+
+    def _not_append_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is append-only; use append or extend")
+
+    appendleft = extendleft = insert = __imul__ = _not_append_only
+
+    def __reduce__(self):
+        # Rebuild from the contents, then restore the counter; the deque default
+        # re-appends items after restoring state, which would double count
+        return self.__class__, (list(self), self.maxlen), (None, {"appended": self.appended})
+
+    def __copy__(self) -> "EventLog":
+        clone = self.__class__(self, self.maxlen)
+        clone.appended = self.appended
+        return clone
 
     def __getitem__(self, index):  # type: ignore[override]
         if isinstance(index, slice):
             return list(self)[index]
         return super().__getitem__(index)
 
+    def since(self, seq: int) -> List[dict]:
+        """Events added after appended was seq (at most the retained ones)."""
+        return self.recent(self.appended - seq)
+
+    def recent(self, count: int) -> List[dict]:
+        """Last count events, oldest first, without copying the whole log."""
+        if count <= 0:
+            return []
+        if count >= len(self):
+            return list(self)
+        tail = list(islice(reversed(self), count))
+        tail.reverse()
+        return tail
+
 
 @dataclass
 class Utilities:
@@ -25,7 +110,7 @@ class Utilities:
     water: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Needs:
     hunger: int = 40     # 0..100 (higher = more hungry)
     fatigue: int = 20    # 0..100
@@ -151,6 +236,31 @@ class World:
         compare=False,
     )  # Reusable RNG instance (excluded from serialization via custom save/load)
 
+    @property
+    def current_tick(self) -> int:
+        """Game tick derived from day and slice (4 ticks per day).
+
+        Unknown slices count as the first slice of the day.
+        """
+        return self.day * 4 + TIME_SLICE_INDEX.get(self.slice, 0)
+
+
+_NEEDS_VALUES = attrgetter(*(f.name for f in fields(Needs)))
+
+
+def _scalar_values(obj: Any) -> Tuple[Any, ...]:
+    """Field values of a dataclass whose fields all hold scalars."""
+    return tuple(vars(obj).values())
+
+
+def _freeze(value: Any) -> Any:
+    """Copy nested dicts/lists into tuples so later edits can't alias them."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 @dataclass
 class State:
@@ -160,13 +270,77 @@ class State:
     utilities: Utilities = field(default_factory=Utilities)
     spaces: Dict[str, Space] = field(default_factory=dict)
     items: List[Item] = field(default_factory=list)
-    event_log: Deque[dict] = field(default_factory=lambda: EventLog(maxlen=MAX_EVENT_LOG))
+    event_log: EventLog = field(default_factory=lambda: EventLog(maxlen=MAX_EVENT_LOG))
     npcs: Dict[str, NPC] = field(default_factory=dict)  # Building NPCs by id
+    # Bumped on every engine.apply_action; not saved (see io.save_state)
+    revision: int = field(default=0, compare=False)
+
+    def touch(self) -> None:
+        """Mark the state as changed so cached views are rebuilt.
+
+        engine.apply_action calls this. Direct writes to the player, world,
+        utilities, items and NPC roster are picked up by fingerprint() anyway;
+        call it after editing anything else (such as space layouts).
+        """
+        self.revision += 1
+
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Snapshot of everything action listings read, for cache keys.
+
+        Two calls return equal tuples only if nothing relevant changed in
+        between, however the state was mutated. Event logs, memories and the
+        world RNG are left out; spaces are static content and are covered by
+        the revision.
+        """
+        world = self.world
+        player = self.player
+        return (
+            self.revision,
+            world.day,
+            world.slice,
+            world.location,
+            _scalar_values(self.utilities),
+            player.money_pence,
+            player.utilities_paid,
+            player.current_job,
+            player.carry_capacity,
+            _NEEDS_VALUES(player.needs),
+            tuple(player.skills.items()),
+            tuple(player.relationships.items()),
+            _scalar_values(player.aptitudes),
+            _scalar_values(player.traits),
+            tuple((name, _scalar_values(s)) for name, s in player.skills_detailed.items()),
+            tuple(player.habit_tracker.items()),
+            _freeze(player.flags),
+            tuple(_scalar_values(it) for it in self.items),
+            tuple(self.npcs),
+        )
 
     def get_items_at(self, location: str) -> List[Item]:
-        """Get all items at a specific location (optimized spatial query)."""
+        """Get all items at a specific location as a new list.
+
+        Not memoized: items are added, removed and moved by assigning
+        state.items and item.placed_in directly, so a cached result could go
+        stale. Callers that query several locations in one pass should use
+        items_by_location() instead.
+        """
         return [item for item in self.items if item.placed_in == location]
 
+    def items_by_location(self) -> Dict[str, List[Item]]:
+        """Group all items by placed_in in a single pass.
+
+        The result is a snapshot: it is not updated when items are added,
+        removed or moved afterwards.
+        """
+        grouped: Dict[str, List[Item]] = {}
+        for item in self.items:
+            bucket = grouped.get(item.placed_in)
+            if bucket is None:
+                grouped[item.placed_in] = [item]
+            else:
+                bucket.append(item)
+        return grouped
+
 
 def generate_instance_id(rng: Optional[random.Random] = None) -> str:
     """Generate a unique instance ID for an item.
@@ -11,7 +11,8 @@ import zlib
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Tuple
 
-from .constants import MAX_EVENT_LOG, TIME_SLICES
+from .action_engine import apply_outcome, compute_tier, validate_action_spec
+from .constants import MAX_EVENT_LOG, TIME_SLICE_INDEX
 from .models import NPC, State
 
 
@@ -120,8 +121,6 @@ def maybe_trigger_daily_building_event(
         item_meta: Item metadata registry
         current_tick: Current game tick
     """
-    from .action_engine import apply_outcome, compute_tier, validate_action_spec
-
     # Use deterministic RNG seeded from simulation seed + day
     day_seed = state.world.rng_seed + state.world.day * 97
 
@@ -272,7 +271,7 @@ def on_player_entered_space(
     encounter_seed = (
         state.world.rng_seed
         + state.world.day * 97
-        + TIME_SLICES.index(state.world.slice) * 13
+        + TIME_SLICE_INDEX.get(state.world.slice, 0) * 13
         + stable_hash(to_space)
     )
     rng = random.Random(encounter_seed)
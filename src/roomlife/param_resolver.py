@@ -13,12 +13,19 @@ def resolve_param_space_id(state: State, value: Any) -> Tuple[bool, str]:
     return True, ""
 
 
-def _find_item_candidates(state: State, item_ref: Dict[str, Any]) -> List[Item]:
+def _find_item_candidates(
+    state: State,
+    item_ref: Dict[str, Any],
+    by_instance: Optional[Dict[str, Item]] = None,
+) -> List[Item]:
     mode = item_ref.get("mode")
     if mode == "instance_id":
         iid = item_ref.get("instance_id")
         if not isinstance(iid, str):
             return []
+        if by_instance is not None:
+            it = by_instance.get(iid)
+            return [it] if it is not None else []
         return [it for it in state.items if getattr(it, "instance_id", None) == iid]
     if mode == "by_item_id":
         item_id = item_ref.get("item_id")
@@ -28,7 +35,11 @@ def _find_item_candidates(state: State, item_ref: Dict[str, Any]) -> List[Item]:
     return []
 
 
-def resolve_param_item_ref(state: State, value: Any) -> Tuple[bool, str]:
+def resolve_param_item_ref(
+    state: State,
+    value: Any,
+    by_instance: Optional[Dict[str, Item]] = None,
+) -> Tuple[bool, str]:
     if not isinstance(value, dict):
         return False, "item_ref must be an object"
 
@@ -37,7 +48,11 @@ def resolve_param_item_ref(state: State, value: Any) -> Tuple[bool, str]:
         iid = value.get("instance_id")
         if not isinstance(iid, str):
             return False, "instance_id must be string"
-        if not any(getattr(it, "instance_id", None) == iid for it in state.items):
+        if by_instance is not None:
+            found = iid in by_instance
+        else:
+            found = any(getattr(it, "instance_id", None) == iid for it in state.items)
+        if not found:
             return False, f"unknown instance_id: {iid}"
         return True, ""
 
@@ -60,9 +75,10 @@ def _validate_item_constraints(
     state: State,
     item_ref: Dict[str, Any],
     constraints: Dict[str, Any],
+    by_instance: Optional[Dict[str, Item]] = None,
 ) -> List[str]:
     issues: List[str] = []
-    candidates = _find_item_candidates(state, item_ref)
+    candidates = _find_item_candidates(state, item_ref, by_instance)
 
     if constraints.get("reachable"):
         if not any(is_item_reachable(state, it) for it in candidates):
@@ -96,12 +112,16 @@ def validate_parameters(
     state: State,
     spec: Any,
     params: Dict[str, Any],
+    by_instance: Optional[Dict[str, Item]] = None,
 ) -> Tuple[bool, List[str]]:
-    missing: List[str] = []
+    """Check an action's parameters against its spec.
 
-    # Supported parameter types
-    SUPPORTED_TYPES = {"space_id", "item_ref", "string", "npc_id"}
+    by_instance is an optional instance_id -> Item index (first instance wins)
+    that replaces scans of state.items when many calls share one state.
+    """
+    missing: List[str] = []
 
+    # Supported parameter types: space_id, item_ref, string, npc_id
     for p in spec.parameters or []:
         name = p["name"]
         if p.get("required") and name not in params:
@@ -115,12 +135,14 @@ def validate_parameters(
             if not ok:
                 missing.append(msg)
         elif ptype == "item_ref":
-            ok, msg = resolve_param_item_ref(state, params[name])
+            ok, msg = resolve_param_item_ref(state, params[name], by_instance)
             if not ok:
                 missing.append(msg)
                 continue
             constraints = p.get("constraints", {})
-            missing.extend(_validate_item_constraints(state, params[name], constraints))
+            missing.extend(
+                _validate_item_constraints(state, params[name], constraints, by_instance)
+            )
         elif ptype == "string":
             # String parameters just need to be present and be a string
             if not isinstance(params[name], str):
@@ -153,23 +175,33 @@ def validate_connected_to_param(
     return True, ""
 
 
-def select_item_instance(state: State, item_ref: Dict[str, Any]) -> Optional[Item]:
+def select_item_instance(
+    state: State,
+    item_ref: Dict[str, Any],
+    by_instance: Optional[Dict[str, Item]] = None,
+) -> Optional[Item]:
     mode = item_ref.get("mode")
     if mode == "instance_id":
         iid = item_ref.get("instance_id")
         if not isinstance(iid, str):
             return None
+        if by_instance is not None:
+            return by_instance.get(iid)
         return next((it for it in state.items if it.instance_id == iid), None)
     if mode == "by_item_id":
         item_id = item_ref.get("item_id")
         if not isinstance(item_id, str):
             return None
-        candidates = [
-            it for it in state.items
-            if it.item_id == item_id and is_item_reachable(state, it)
-        ]
-        candidates.sort(key=lambda it: it.condition_value, reverse=True)
-        return candidates[0] if candidates else None
+        # Best-condition reachable copy; max() keeps the first of equal copies
+        # in state order, as the previous stable descending sort did
+        return max(
+            (
+                it for it in state.items
+                if it.item_id == item_id and is_item_reachable(state, it)
+            ),
+            key=lambda it: it.condition_value,
+            default=None,
+        )
     return None
 
 
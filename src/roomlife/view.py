@@ -7,16 +7,19 @@ from .action_call import ActionCall
 from .catalog import ActionCatalog
 from .constants import SKILL_NAMES
 from .content_specs import load_actions, load_item_meta
+from .engine import format_display_name
 from .models import State
 
 # Global cache for specs (loaded once)
 _ACTION_SPECS = None
 _ITEM_META = None
+# Catalog over the cached specs, built once with them
+_CATALOG = None
 
 
 def _ensure_specs_loaded():
-    """Lazy load action specs and item metadata."""
-    global _ACTION_SPECS, _ITEM_META
+    """Lazy load action specs, item metadata and the action catalog."""
+    global _ACTION_SPECS, _ITEM_META, _CATALOG
     data_dir = Path(__file__).parent.parent.parent / "data"
 
     if _ACTION_SPECS is None:
@@ -31,6 +34,8 @@ def _ensure_specs_loaded():
             _ITEM_META = load_item_meta(items_path)
         else:
             _ITEM_META = {}
+    if _CATALOG is None:
+        _CATALOG = ActionCatalog(_ACTION_SPECS, _ITEM_META)
 
 
 def build_view_model(state: State) -> Dict:
@@ -46,14 +51,13 @@ def build_view_model(state: State) -> Dict:
         skill = p.skills_detailed[skill_name]
         if skill.value > 0:
             active_skills.append({
-                "name": skill_name.replace("_", " ").title(),
+                "name": format_display_name(skill_name),
                 "value": round(skill.value, 2),
             })
 
     # Build actions list from ActionCatalog
     _ensure_specs_loaded()
-    catalog = ActionCatalog(_ACTION_SPECS, _ITEM_META)
-    action_cards = catalog.list_available(state)
+    action_cards = _CATALOG.list_available(state)
 
     # Convert ActionCards to hint format
     actions_hint = []
@@ -121,6 +125,6 @@ def build_view_model(state: State) -> Dict:
             {"item_id": it.item_id, "condition": it.condition, "slot": it.slot}
             for it in state.get_items_at(loc)
         ],
-        "recent_events": list(state.event_log)[-6:],
+        "recent_events": state.event_log.recent(6),
         "actions_hint": actions_hint,
     }
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from roomlife import engine
 from roomlife.content_specs import load_actions
 from roomlife.engine import new_game
@@ -122,3 +124,164 @@ def test_tier_floor_clamps_computed_tier():
     )
     assert clamp_tier(spec_zero, 0) == 0
     assert clamp_tier(spec_zero, 1) == 1
+
+
+def test_validation_context_matches_uncached_validation():
+    """Validating with a shared ValidationContext gives the same results as without."""
+    from roomlife.action_engine import build_validation_context, validate_action_spec
+
+    state = new_game(seed=42)
+    engine._ensure_specs_loaded()
+
+    for location in ("room_001", "kitchen_001", "bath_001"):
+        state.world.location = location
+        ctx = build_validation_context(state, engine._ITEM_META)
+        for spec in engine._ACTION_SPECS.values():
+            expected = validate_action_spec(state, spec, engine._ITEM_META, {})
+            assert validate_action_spec(state, spec, engine._ITEM_META, {}, ctx) == expected
+
+
+def test_validation_context_groups_items_by_location():
+    """The context's item index agrees with direct scans of state.items."""
+    from roomlife.action_engine import build_validation_context
+
+    state = new_game(seed=42)
+    engine._ensure_specs_loaded()
+
+    ctx = build_validation_context(state, engine._ITEM_META)
+    for location in set(state.spaces) | {"inventory"}:
+        assert ctx.items_by_location.get(location, []) == state.get_items_at(location)
+    reachable = [
+        item for item in state.items
+        if item.placed_in in (state.world.location, "inventory")
+    ]
+    expected_first = {}
+    for item in reachable:
+        expected_first.setdefault(item.item_id, item)
+    assert list(ctx.first_reachable.items()) == list(expected_first.items())
+
+
+def test_validation_context_matches_uncached_item_ref_validation():
+    """Item-ref parameters resolve the same through the context's instance index."""
+    from roomlife.action_engine import build_validation_context, validate_action_spec
+
+    state = new_game(seed=42)
+    engine._ensure_specs_loaded()
+    ctx = build_validation_context(state, engine._ITEM_META)
+
+    refs = [{"mode": "instance_id", "instance_id": item.instance_id} for item in state.items]
+    refs.append({"mode": "instance_id", "instance_id": "missing"})
+    for action_id in ("repair_item", "pick_up_item", "drop_item"):
+        spec = engine._ACTION_SPECS[action_id]
+        for ref in refs:
+            params = {"item_ref": ref}
+            expected = validate_action_spec(state, spec, engine._ITEM_META, params)
+            assert validate_action_spec(state, spec, engine._ITEM_META, params, ctx) == expected
+
+
+@pytest.mark.parametrize(
+    ("legacy_id", "action_id", "params"),
+    [
+        ("move_hall_001", "move", {"target_space": "hall_001"}),
+        ("repair_kettle", "repair_item", {"item_ref": {"mode": "by_item_id", "item_id": "kettle"}}),
+        ("purchase_kettle", "purchase_item", {"item_id": "kettle"}),
+        ("sell_kettle", "sell_item", {"item_id": "kettle"}),
+        ("discard_kettle", "discard_item", {"item_id": "kettle"}),
+        ("apply_job_barista", "apply_job", {"job_id": "barista"}),
+        ("cook_meal", "cook_basic_meal", {}),
+        ("rest", "rest", {}),
+    ],
+)
+def test_action_call_from_legacy_maps_prefixes(legacy_id, action_id, params):
+    from roomlife.action_call import ActionCall
+
+    assert ActionCall.from_legacy(legacy_id) == ActionCall(action_id, params)
+
+
+def test_pay_utilities_charges_computed_cost():
+    from roomlife.action_engine import compute_utilities_cost
+
+    state = new_game()
+    state.player.money_pence = 10000
+    state.player.skills_detailed["resource_management"].value = 12.5
+    state.player.traits.frugality = 60
+    state.player.flags["utilities_discount_pence"] = 300
+
+    cost = compute_utilities_cost(state)
+    assert cost == int(2000 - 125 - 120 - 300)
+
+    engine.apply_action(state, "pay_utilities", rng_seed=1)
+    assert state.player.money_pence == 10000 - cost
+    assert "utilities_discount_pence" not in state.player.flags
+
+
+def test_legacy_suffix_shares_identity_with_item_meta_key():
+    from roomlife.action_call import ActionCall
+    from roomlife.content_specs import load_item_meta
+
+    item_meta = load_item_meta(Path(__file__).resolve().parents[1] / "data" / "items_meta.yaml")
+    item_id = next(iter(item_meta))
+    call = ActionCall.from_legacy("sell_" + item_id)
+    assert call.params["item_id"] == item_id
+    assert call.params["item_id"] is item_meta[item_id].id
+
+
+def test_loaded_space_ids_and_connections_are_interned():
+    import sys
+
+    from roomlife.content_specs import load_spaces
+
+    spaces = load_spaces(Path(__file__).resolve().parents[1] / "data" / "spaces.yaml")
+    for space_id, spec in spaces.items():
+        assert spec.id is space_id
+        assert space_id is sys.intern(space_id)
+        for connection in spec.connections:
+            assert connection is sys.intern(connection)
+
+
+def test_action_call_and_card_are_slotted():
+    from roomlife.action_call import ActionCall
+    from roomlife.catalog import ActionCard
+
+    call = ActionCall("rest", {})
+    card = ActionCard(call=call, display_name="Rest", description="", available=True)
+    assert not hasattr(call, "__dict__")
+    assert not hasattr(card, "__dict__")
+
+
+def test_get_items_at_reflects_direct_item_moves():
+    """get_items_at sees placed_in changes made between calls."""
+    state = new_game(seed=42)
+    location = state.world.location
+    first = state.get_items_at(location)
+    assert first
+
+    moved = first[0]
+    moved.placed_in = "inventory"
+    assert moved not in state.get_items_at(location)
+    assert moved in state.get_items_at("inventory")
+    # The earlier result is a separate list and is left untouched
+    assert moved in first
+
+
+def test_param_specific_checks_mark_specs_param_dependent(monkeypatch):
+    from roomlife import action_engine
+
+    engine._ensure_specs_loaded()
+    spec = engine._ACTION_SPECS["purchase_item"]
+    assert action_engine.param_values_affect_validation(engine._ACTION_SPECS["repair_item"])
+    assert not action_engine.param_values_affect_validation(spec)
+
+    calls = []
+    monkeypatch.setitem(
+        action_engine._PARAM_CHECKS,
+        "purchase_item",
+        lambda state, spec, params, by_instance: calls.append(params) or ["checked"],
+    )
+    assert action_engine.param_values_affect_validation(spec)
+    ok, _, missing = action_engine.validate_action_spec(
+        new_game(), spec, engine._ITEM_META, {"item_id": "kettle"}
+    )
+    assert not ok
+    assert "checked" in missing
+    assert calls == [{"item_id": "kettle"}]
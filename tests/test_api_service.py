@@ -1,7 +1,7 @@
 """Tests for API service in api_service.py."""
 
 from roomlife.api_service import RoomLifeAPI
-from roomlife.api_types import EventInfo, GameStateSnapshot
+from roomlife.api_types import ActionCategory, EventInfo, GameStateSnapshot
 from roomlife.engine import new_game
 
 
@@ -149,6 +149,20 @@ def test_get_state_snapshot_all_locations():
     assert "kitchen_001" in snapshot.all_locations
 
 
+def test_api_instances_share_parsed_specs_but_not_dicts():
+    """Test that content is parsed once and each API gets its own dicts."""
+    first = RoomLifeAPI(new_game())
+    second = RoomLifeAPI(new_game())
+
+    assert first._action_specs is not second._action_specs
+    assert first._item_meta is not second._item_meta
+    assert first._action_specs["rest"] is second._action_specs["rest"]
+
+    del first._action_specs["rest"]
+    assert "rest" in second._action_specs
+    assert "rest" in RoomLifeAPI(new_game())._action_specs
+
+
 def test_get_available_actions():
     """Test getting available actions."""
     state = new_game()
@@ -207,8 +221,8 @@ def test_validate_action_with_preview():
     state.player.money_pence = 10000  # Ensure enough money
     api = RoomLifeAPI(state)
 
-    # Cook meal should have preview if valid
-    validation = api.validate_action("cook_meal")
+    # Cook meal should have preview if valid and requested
+    validation = api.validate_action("cook_meal", include_preview=True)
 
     if validation.valid:
         assert validation.preview is not None
@@ -216,6 +230,21 @@ def test_validate_action_with_preview():
         assert hasattr(validation.preview, "delta_ranges")
 
 
+def test_validate_action_skips_preview_by_default():
+    """Test that plain validation does not sample a preview."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    validation = api.validate_action("sleep")
+    assert validation.valid
+    assert validation.preview is None
+
+    preview = api.get_action_preview("sleep")
+    assert preview == api.validate_action("sleep", include_preview=True).preview
+    assert preview is not None and preview.tier_distribution
+    assert api.get_action_preview("nonexistent_action") is None
+
+
 def test_execute_action_success():
     """Test executing a simple action."""
     state = new_game()
@@ -247,6 +276,44 @@ def test_execute_action_generates_events():
         assert hasattr(event, "params")
 
 
+def test_execute_action_reports_events_once_log_is_full():
+    """Test that new events are still reported after the bounded log fills up."""
+    from roomlife.constants import MAX_EVENT_LOG
+
+    state = new_game()
+    api = RoomLifeAPI(state)
+    for i in range(MAX_EVENT_LOG):
+        state.event_log.append({"event_id": "test.filler", "params": {"i": i}})
+    assert len(state.event_log) == MAX_EVENT_LOG
+
+    result = api.execute_action("rest", rng_seed=42)
+
+    assert result.events_triggered
+    assert all(e.event_id != "test.filler" for e in result.events_triggered)
+    assert [e.event_id for e in result.events_triggered] == [
+        e.event_id for e in api.get_state_snapshot().recent_events[-len(result.events_triggered):]
+    ]
+
+
+def test_execute_action_without_snapshot():
+    """Test that return_snapshot=False skips the snapshot but keeps the diff."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    result = api.execute_action("sleep", rng_seed=42, return_snapshot=False)
+    assert result.new_state is None
+    assert result.to_dict()["new_state"] is None
+    assert result.state_changes["needs"]["fatigue"] < 0
+    assert result.events_triggered
+
+    # State-change listeners still get a snapshot
+    seen = []
+    api.subscribe_to_state_changes(seen.append)
+    result = api.execute_action("rest", rng_seed=42, return_snapshot=False)
+    assert len(seen) == 1
+    assert result.new_state is seen[0]
+
+
 def test_execute_action_updates_state():
     """Test that executing actions updates the game state."""
     state = new_game()
@@ -468,3 +535,571 @@ def test_get_state_snapshot_recent_events():
     assert len(snapshot.recent_events) > 0
     # Recent events should be capped at 10
     assert len(snapshot.recent_events) <= 10
+
+
+def test_recent_events_reused_until_log_changes():
+    """Test that snapshots share EventInfo objects until new events arrive."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    first = api.get_state_snapshot().recent_events
+    second = api.get_state_snapshot().recent_events
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+    api.execute_action("rest")
+    after = api.get_state_snapshot().recent_events
+    assert after[-1].event_id == state.event_log[-1]["event_id"]
+
+    state.event_log.clear()
+    assert api.get_state_snapshot().recent_events == []
+
+
+def test_recent_events_follow_every_log_edit():
+    """Test that cached recent events track in-place edits to a full log."""
+    state = new_game()
+    log = state.event_log
+    log.extend({"event_id": f"filler.{i}"} for i in range(log.maxlen))
+    api = RoomLifeAPI(state)
+
+    def latest():
+        return api.get_state_snapshot().recent_events[-1].event_id
+
+    assert latest() == f"filler.{log.maxlen - 1}"
+    log += [{"event_id": "added.inplace"}]
+    assert latest() == "added.inplace"
+
+    log.pop()
+    log.append({"event_id": "pop.then.append"})
+    assert latest() == "pop.then.append"
+
+    log[-1] = {"event_id": "replaced"}
+    assert latest() == "replaced"
+
+    log.rotate(1)
+    assert latest() == log[-1]["event_id"]
+
+
+def test_events_without_params_share_empty_mapping():
+    """Test that log entries lacking params map to the shared empty mapping."""
+    import copy
+    import pickle
+
+    from roomlife.api_types import EMPTY_MAPPING
+
+    state = new_game()
+    state.event_log.append({"event_id": "legacy.event"})
+    api = RoomLifeAPI(state)
+
+    snapshot = api.get_state_snapshot(snapshot_copy=True)
+    event = snapshot.recent_events[-1]
+    assert event.params is EMPTY_MAPPING
+    assert event.to_dict() == {"event_id": "legacy.event", "params": {}}
+
+    # The shared default must not stop callers copying the snapshot
+    copied = copy.deepcopy(snapshot)
+    assert copied.recent_events[-1] == event
+    assert pickle.loads(pickle.dumps(event)) == event
+
+
+def test_snapshot_to_dict_matches_dataclass_fields():
+    """Test that hand-written to_dict keeps the same keys and values as asdict."""
+    from dataclasses import asdict
+
+    state = new_game()
+    api = RoomLifeAPI(state)
+    api.execute_action("cook_meal", rng_seed=42)
+
+    snapshot = api.get_state_snapshot()
+    data = snapshot.to_dict()
+
+    assert data["needs"] == asdict(snapshot.needs)
+    assert data["traits"] == asdict(snapshot.traits)
+    assert data["world"] == asdict(snapshot.world)
+    assert data["skills"] == [asdict(skill) for skill in snapshot.skills]
+    assert data["current_location"] == asdict(snapshot.current_location)
+    assert data["recent_events"] == [asdict(event) for event in snapshot.recent_events]
+
+
+def test_action_metadata_to_dict_returns_plain_dicts():
+    """Test that shared read-only mappings come back as plain dicts."""
+    from dataclasses import fields
+
+    api = RoomLifeAPI(new_game())
+
+    for action in api.get_all_actions_metadata():
+        data = action.to_dict()
+        assert set(data) == {f.name for f in fields(action)}
+        assert type(data["requirements"]) is dict
+        assert type(data["effects"]) is dict
+        assert data["requirements"] == dict(action.requirements)
+
+
+def test_action_metadata_to_dict_copies_nested_values():
+    """Test that mutating to_dict output leaves specs and params untouched."""
+    from copy import deepcopy
+
+    api = RoomLifeAPI(new_game())
+    actions = api.get_all_actions_metadata()
+    before = [(deepcopy(dict(a.requirements)), deepcopy(a.params)) for a in actions]
+
+    for action in actions:
+        data = action.to_dict()
+        for value in data["requirements"].values():
+            if isinstance(value, (dict, list)):
+                value.clear()
+        for value in (data["params"] or {}).values():
+            if isinstance(value, dict):
+                value.clear()
+
+    assert [(dict(a.requirements), a.params) for a in actions] == before
+
+
+def test_api_types_are_slotted_and_frozen():
+    """Test that every API dataclass is slotted and immutable."""
+    from dataclasses import FrozenInstanceError, is_dataclass
+
+    import pytest
+
+    from roomlife import api_types
+
+    for obj in vars(api_types).values():
+        if isinstance(obj, type) and is_dataclass(obj) and obj.__module__ == api_types.__name__:
+            assert "__slots__" in vars(obj), obj.__name__
+            assert obj.__dataclass_params__.frozen, obj.__name__
+
+    preview = RoomLifeAPI(new_game()).get_action_preview("rest")
+    with pytest.raises(FrozenInstanceError):
+        preview.notes = []
+
+
+def test_shared_empty_mapping_copies_like_a_dict():
+    """Test that metadata holding the shared empty mapping can be copied."""
+    import copy
+    import pickle
+    from dataclasses import asdict
+
+    import pytest
+
+    from roomlife.api_types import EMPTY_MAPPING, ActionMetadata, AvailableActionsResponse
+
+    action = ActionMetadata(
+        action_id="rest",
+        display_name="Rest",
+        description="",
+        category=ActionCategory.OTHER,
+        requirements=EMPTY_MAPPING,
+        effects=EMPTY_MAPPING,
+    )
+    listing = AvailableActionsResponse(actions=[action], location="room_001", total_count=1)
+
+    assert copy.deepcopy(listing) == listing
+    assert pickle.loads(pickle.dumps(listing)) == listing
+    assert asdict(listing)["actions"][0]["requirements"] == {}
+    with pytest.raises(TypeError):
+        EMPTY_MAPPING["x"] = 1
+    assert EMPTY_MAPPING == {}
+
+
+def test_action_listings_copy_and_pickle():
+    """Test that listings with shared requirements and previews can be copied."""
+    import copy
+    import pickle
+    from dataclasses import asdict
+
+    api = RoomLifeAPI(new_game())
+    listing = api.get_available_actions()
+    actions = api.get_all_actions_metadata()
+    assert any(a.requirements for a in actions)
+
+    assert copy.deepcopy(listing) == listing
+    assert pickle.loads(pickle.dumps(actions)) == actions
+    for action, as_dict in zip(actions, map(asdict, actions), strict=True):
+        assert as_dict["requirements"] == action.to_dict()["requirements"]
+
+
+def test_validation_to_dict_matches_asdict():
+    """Test that hand-written validation and preview to_dict match asdict."""
+    from dataclasses import asdict
+
+    api = RoomLifeAPI(new_game())
+
+    validation = api.validate_action("rest", include_preview=True)
+    assert validation.preview is not None
+    data = validation.to_dict()
+    assert data == asdict(validation)
+    assert data["preview"]["delta_ranges"] is not validation.preview.delta_ranges
+    locked = api.validate_action("cook_basic_meal")
+    assert locked.to_dict() == asdict(locked)
+
+
+def test_get_state_snapshot_partial_sections():
+    """Test that optional snapshot sections can be skipped."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    snapshot = api.get_state_snapshot(
+        include_all_locations=False,
+        include_skills=False,
+        include_events=False,
+    )
+
+    assert snapshot.all_locations is None
+    assert snapshot.skills is None
+    assert snapshot.recent_events is None
+    assert snapshot.current_location.space_id == "room_001"
+    data = snapshot.to_dict()
+    assert data["all_locations"] is None
+    assert data["needs"] == snapshot.needs.to_dict()
+
+
+def test_unsafe_event_listener_propagates_errors():
+    """Test that listeners subscribed with safe=False are called without isolation."""
+    import pytest
+
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    def failing_callback(event: EventInfo):
+        raise ValueError("Test error")
+
+    api.subscribe_to_events(failing_callback, safe=False)
+
+    with pytest.raises(ValueError, match="Test error"):
+        api.execute_action("cook_meal", rng_seed=42)
+
+
+def test_iter_available_actions_matches_list():
+    """Test that lazily yielded actions match get_available_actions."""
+    api = RoomLifeAPI(new_game())
+
+    listed = api.get_available_actions().actions
+    iterated = list(api.iter_available_actions())
+
+    assert [a.action_id for a in iterated] == [a.action_id for a in listed]
+    assert [a.params for a in iterated] == [a.params for a in listed]
+    assert all(action.available for action in iterated)
+
+
+def test_available_actions_filtered_by_category():
+    """Test that a category filter matches filtering the full list."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+    wanted = {ActionCategory.MOVEMENT, ActionCategory.WORK}
+
+    # Uncached path builds only the requested listings
+    filtered = api.get_available_actions(categories=wanted).actions
+    assert api._available_cache is None
+    full = api.get_available_actions().actions
+    expected = [a for a in full if a.category in wanted]
+    assert filtered == expected
+    assert expected
+    # Cached path filters the stored list
+    assert api.get_available_actions(categories=wanted).actions == expected
+    assert list(api.iter_available_actions(categories=set())) == []
+
+
+def test_category_filter_skips_unrequested_listings():
+    """Test that job and shop listings are not built when not requested."""
+    api = RoomLifeAPI(new_game())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("listing should have been skipped")
+
+    api._catalog._list_apply_job_actions = fail
+    api._catalog._list_purchase_actions = fail
+    api._catalog._list_sell_and_discard_actions = fail
+
+    moves = api.get_available_actions(categories={ActionCategory.MOVEMENT}).actions
+    assert moves
+    assert all(a.category == ActionCategory.MOVEMENT for a in moves)
+
+
+def test_iter_all_actions_metadata_is_lazy_and_matches_list():
+    """Test that the streaming form yields the same metadata and can stop early."""
+    from itertools import islice
+
+    api = RoomLifeAPI(new_game())
+
+    listed = api.get_all_actions_metadata()
+    assert list(api.iter_all_actions_metadata()) == listed
+    assert list(islice(api.iter_all_actions_metadata(), 3)) == listed[:3]
+
+
+def test_metadata_previews_match_per_action_previews():
+    """Test that previews shared across cards match previews built per call."""
+    api = RoomLifeAPI(new_game())
+
+    actions = api.get_all_actions_metadata()
+    assert sum(1 for a in actions if a.action_id == "purchase_item") > 1
+    for action in actions:
+        expected = api.get_action_preview(action.action_id, action.params or {})
+        assert action.preview == expected
+
+
+def test_shared_previews_are_read_only():
+    """Test that previews shared across cards and calls can't be edited."""
+    import pytest
+
+    api = RoomLifeAPI(new_game())
+
+    purchases = [a for a in api.get_all_actions_metadata() if a.action_id == "purchase_item"]
+    preview = purchases[0].preview
+    with pytest.raises(TypeError):
+        preview.tier_distribution[0] = 1.0
+    for ranges in preview.delta_ranges.values():
+        with pytest.raises(TypeError):
+            ranges["hunger"] = {"min": 0, "max": 0}
+    assert preview.to_dict()["tier_distribution"] == dict(preview.tier_distribution)
+
+
+def test_get_available_actions_cached_until_state_changes():
+    """Test that available actions are reused until the state changes."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    first = api.get_available_actions()
+    assert api.get_available_actions().actions == first.actions
+    cached = api._available_cache
+
+    # Direct mutation is picked up without touch()
+    state.player.money_pence = 0
+    poorer = api.get_available_actions()
+    assert not any(a.action_id == "purchase_item" for a in poorer.actions)
+    assert api._available_cache is not cached
+
+    api.execute_action("rest")
+    assert api.get_available_actions().location == state.world.location
+    assert api._available_cache[1] == state.fingerprint()
+
+
+def test_get_available_actions_sees_direct_location_change():
+    """Test that moving the player directly invalidates cached actions."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+    before = api.get_available_actions()
+
+    other = next(s for s in state.spaces if s != state.world.location)
+    state.world.location = other
+    after = api.get_available_actions()
+    assert after.location == other
+    assert after.actions == list(api.iter_available_actions())
+    assert after.actions != before.actions
+
+
+def test_state_fingerprint_tracks_nested_edits():
+    """Test that in-place edits to nested state change the fingerprint."""
+    state = new_game()
+    base = state.fingerprint()
+    assert state.fingerprint() == base
+
+    state.player.skills_detailed["cooking"].value += 1
+    assert state.fingerprint() != base
+    base = state.fingerprint()
+
+    state.items[0].placed_in = "inventory"
+    assert state.fingerprint() != base
+    base = state.fingerprint()
+
+    state.player.flags.setdefault("goals.today", []).append("x")
+    assert state.fingerprint() != base
+
+
+def test_all_actions_metadata_cached_until_state_changes():
+    """Test that the full metadata list is reused until the state changes."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    first = api.get_all_actions_metadata()
+    second = api.get_all_actions_metadata()
+    assert second == first
+    assert second is not first
+
+    state.player.money_pence = 0
+    locked = [a for a in api.get_all_actions_metadata() if a.action_id == "purchase_item"]
+    assert locked and not any(a.available for a in locked)
+
+
+def test_needs_diff_covers_every_needs_field():
+    """Test that needs/traits are read in snapshot constructor order."""
+    from dataclasses import fields
+
+    from roomlife.api_service import _NEEDS_FIELDS, _needs_delta
+    from roomlife.api_types import NeedsSnapshot, TraitsSnapshot
+    from roomlife.models import Traits
+
+    assert _NEEDS_FIELDS == tuple(f.name for f in fields(NeedsSnapshot))
+    assert [f.name for f in fields(Traits)] == [f.name for f in fields(TraitsSnapshot)]
+    old = tuple(range(len(_NEEDS_FIELDS)))
+    new = old[:-1] + (old[-1] + 5,)
+    assert _needs_delta(old, new) == {_NEEDS_FIELDS[-1]: 5}
+
+
+def test_action_metadata_category_matches_spec():
+    """Test that the precomputed per-action category matches each spec's category."""
+    api = RoomLifeAPI(new_game())
+
+    for action in api.get_all_actions_metadata():
+        spec = api._action_specs[action.action_id]
+        expected = (spec.category or "other").strip().lower()
+        if expected not in {c.value for c in ActionCategory}:
+            expected = "other"
+        assert action.category.value == expected
+
+
+def test_action_metadata_shares_requirements_per_spec():
+    """Test that cards for the same spec share one read-only requirements view."""
+    api = RoomLifeAPI(new_game())
+
+    purchases = [a for a in api.get_all_actions_metadata() if a.action_id == "purchase_item"]
+    assert len(purchases) > 1
+    assert all(a.requirements is purchases[0].requirements for a in purchases)
+
+
+def test_available_actions_match_filtered_metadata_at_any_budget():
+    """Test that skipping unaffordable purchases matches filtering all actions."""
+    for money in (0, 1500, 1_000_000):
+        state = new_game()
+        state.player.money_pence = money
+        api = RoomLifeAPI(state)
+
+        available = [(a.action_id, a.params) for a in api.get_available_actions().actions]
+        expected = [
+            (a.action_id, a.params) for a in api.get_all_actions_metadata() if a.available
+        ]
+        assert available == expected
+
+
+def test_location_info_reused_until_items_change():
+    """Test that unchanged spaces reuse LocationInfo and changed ones rebuild."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    first = api.get_state_snapshot()
+    second = api.get_state_snapshot()
+    assert second.current_location is first.current_location
+
+    item = state.get_items_at(state.world.location)[0]
+    item.condition_value -= 10
+    third = api.get_state_snapshot()
+    assert third.current_location is not first.current_location
+    changed = next(i for i in third.current_location.items if i.instance_id == item.instance_id)
+    assert changed.condition_value == item.condition_value
+
+
+def test_skill_info_reused_until_skill_changes():
+    """Test that unchanged skills reuse SkillInfo and changed ones rebuild."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    first = {skill.name: skill for skill in api.get_state_snapshot().skills}
+    state.player.skills_detailed["cooking"].value += 5.0
+    second = {skill.name: skill for skill in api.get_state_snapshot().skills}
+
+    assert second["cooking"] is not first["cooking"]
+    assert second["cooking"].value == state.player.skills_detailed["cooking"].value
+    assert second["maintenance"] is first["maintenance"]
+
+
+def test_all_locations_built_lazily_from_captured_values():
+    """Test that lazily built locations reflect the state when the snapshot was taken."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    snapshot = api.get_state_snapshot()
+    item = state.get_items_at("room_001")[0]
+    before = item.condition_value
+    item.condition_value -= 10
+
+    room = snapshot.all_locations["room_001"]
+    captured = next(i for i in room.items if i.instance_id == item.instance_id)
+    assert captured.condition_value == before
+    assert set(snapshot.all_locations) == set(state.spaces)
+    assert snapshot.to_dict()["all_locations"]["room_001"] == room.to_dict()
+
+
+def test_full_snapshot_copies_and_pickles():
+    """Test that snapshots with lazy locations hold no live API or state."""
+    import copy
+    import pickle
+    from dataclasses import asdict
+
+    api = RoomLifeAPI(new_game())
+    snapshot = api.get_state_snapshot()
+
+    copied = copy.deepcopy(snapshot)
+    assert copied == snapshot
+    assert dict(copied.all_locations) == dict(snapshot.all_locations)
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    as_dict = asdict(snapshot)
+    assert set(as_dict["all_locations"]) == set(snapshot.all_locations)
+    assert as_dict["current_location"] == snapshot.current_location.to_dict()
+
+
+def test_current_location_is_its_all_locations_entry():
+    """Test that current_location is shared with all_locations, not rebuilt."""
+    state = new_game()
+    api = RoomLifeAPI(state)
+
+    snapshot = api.get_state_snapshot()
+    assert snapshot.all_locations[state.world.location] is snapshot.current_location
+
+    without_all = api.get_state_snapshot(include_all_locations=False)
+    assert without_all.all_locations is None
+    assert without_all.current_location == snapshot.current_location
+
+
+def test_habit_tracker_view_and_copy():
+    """Test that habit_tracker is a live read-only view unless a copy is requested."""
+    import pytest
+
+    state = new_game()
+    api = RoomLifeAPI(state)
+    state.player.habit_tracker["confidence"] = 5
+
+    view = api.get_state_snapshot().habit_tracker
+    copied = api.get_state_snapshot(snapshot_copy=True).habit_tracker
+    with pytest.raises(TypeError):
+        view["confidence"] = 1
+
+    state.player.habit_tracker["confidence"] = 6
+    assert view["confidence"] == 6
+    assert copied["confidence"] == 5
+    assert type(api.get_state_snapshot().to_dict()["habit_tracker"]) is dict
+
+
+def test_default_snapshot_copies_and_pickles():
+    """Test that a default snapshot with a live habit view can be copied."""
+    import copy
+    import pickle
+    from dataclasses import asdict
+
+    state = new_game()
+    api = RoomLifeAPI(state)
+    state.player.habit_tracker["confidence"] = 5
+    snapshot = api.get_state_snapshot(include_all_locations=False)
+
+    detached = copy.deepcopy(snapshot)
+    assert detached == snapshot
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    assert asdict(snapshot)["habit_tracker"] == {"confidence": 5}
+
+    state.player.habit_tracker["confidence"] = 6
+    assert snapshot.habit_tracker["confidence"] == 6
+    assert detached.habit_tracker["confidence"] == 5
+
+
+def test_adapter_json_encoder_matches_json_dumps():
+    """Test that the adapters' shared encoder produces json.dumps output."""
+    import json
+
+    from roomlife.api_adapters import _encode_json
+
+    api = RoomLifeAPI(new_game())
+    result = api.execute_action("cook_meal", rng_seed=42)
+    for payload in (
+        {"type": "state_update", "data": api.get_state_snapshot().to_dict()},
+        {"type": "actions_list", "data": api.get_available_actions().to_dict()},
+        {"type": "action_result", "data": result.to_dict()},
+    ):
+        assert _encode_json(payload) == json.dumps(payload)
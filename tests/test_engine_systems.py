@@ -286,6 +286,71 @@ def test_calculate_current_tick():
     assert _calculate_current_tick(state) == 10
 
 
+def test_world_current_tick_matches_calculation():
+    """World.current_tick agrees with the engine tick for every slice."""
+    state = new_game()
+
+    for day in (0, 1, 7):
+        for slice_name in ("morning", "afternoon", "evening", "night"):
+            state.world.day = day
+            state.world.slice = slice_name
+            assert state.world.current_tick == _calculate_current_tick(state)
+
+
+def test_event_log_sequence_survives_eviction_and_copy():
+    """EventLog.since() returns only newer events even after old ones are evicted."""
+    import copy
+    import pickle
+
+    from roomlife.models import EventLog
+
+    log = EventLog([{"n": 0}, {"n": 1}], maxlen=3)
+    seq = log.appended
+    log.append({"n": 2})
+    log.extend([{"n": 3}, {"n": 4}])
+
+    assert log.appended == 5
+    assert log.since(seq) == [{"n": 2}, {"n": 3}, {"n": 4}]
+    assert log.recent(2) == [{"n": 3}, {"n": 4}]
+    assert log.since(log.appended) == []
+    for clone in (copy.copy(log), copy.deepcopy(log), pickle.loads(pickle.dumps(log))):
+        assert list(clone) == list(log)
+        assert clone.maxlen == 3
+        assert clone.appended == log.appended
+
+
+def test_event_log_inplace_add_is_counted():
+    """log += events goes through extend, so since() sees them on a full log."""
+    from roomlife.models import EventLog
+
+    log = EventLog([{"n": 0}, {"n": 1}], maxlen=2)
+    seq = log.appended
+    log += [{"n": 2}]
+
+    assert isinstance(log, EventLog)
+    assert log.appended == 3
+    assert log.since(seq) == [{"n": 2}]
+
+
+def test_event_log_rejects_out_of_order_inserts():
+    """Events can only be added at the end, where since() counts them."""
+    import pytest
+
+    from roomlife.models import EventLog
+
+    log = EventLog([{"n": 0}], maxlen=3)
+    with pytest.raises(TypeError):
+        log.appendleft({"n": -1})
+    with pytest.raises(TypeError):
+        log.extendleft([{"n": -1}])
+    with pytest.raises(TypeError):
+        log.insert(0, {"n": -1})
+    with pytest.raises(TypeError):
+        log *= 2
+    assert list(log) == [{"n": 0}]
+    assert log.appended == 1
+
+
 def test_check_job_requirements_no_requirements():
     """Test job with no requirements is always available."""
     from roomlife.constants import JOBS
@@ -337,6 +402,22 @@ def test_check_job_requirements_invalid_job():
     assert reason == "job_not_found"
 
 
+def test_check_job_requirements_with_prefetched_items():
+    """Test that passing the current location's items gives the same answers."""
+    from roomlife.constants import JOBS
+
+    state = new_game()
+    state.player.skills_detailed["technical_literacy"].value = 60
+    items_here = state.get_items_at(state.world.location)
+    for job_id in JOBS:
+        assert _check_job_requirements(state, job_id, items_here) == _check_job_requirements(
+            state, job_id
+        )
+    state.player.skills_detailed["focus"].value = 40
+    met, _ = _check_job_requirements(state, "junior_developer", [])
+    assert not met
+
+
 def test_get_item_effectiveness_pristine():
     """Test item effectiveness for pristine items."""
     item = Item(
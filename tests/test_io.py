@@ -214,3 +214,23 @@ def test_save_and_load_habit_tracker():
         assert loaded_state.player.habit_tracker["confidence"] == 50
         assert loaded_state.player.habit_tracker["discipline"] == 30
         assert loaded_state.player.habit_tracker["frugality"] == 25
+
+
+def test_loaded_item_strings_are_interned():
+    """Test that repeated item strings are interned when a save is loaded."""
+    import sys
+
+    state = new_game()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_path = Path(tmpdir) / "test_intern.yaml"
+        save_state(state, save_path)
+
+        loaded_state = load_state(save_path)
+
+    assert loaded_state.items
+    for item in loaded_state.items:
+        assert item.item_id is sys.intern(item.item_id)
+        assert item.placed_in is sys.intern(item.placed_in)
+        assert item.slot is sys.intern(item.slot)
+        assert item.condition is sys.intern(item.condition)
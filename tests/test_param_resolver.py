@@ -222,6 +222,29 @@ def test_select_item_instance_by_item_id_prefers_best_condition():
     assert item.condition_value == 100
 
 
+def test_select_item_instance_by_item_id_tie_keeps_state_order():
+    """Test that equal-condition copies resolve to the first one in state order."""
+    state = new_game()
+    state.world.location = "room_001"
+
+    for instance_id in ("tie_001", "tie_002"):
+        state.items.append(Item(
+            instance_id=instance_id,
+            item_id="kettle_spare",
+            placed_in="room_001",
+            container=None,
+            slot="floor",
+            quality=1.0,
+            condition="used",
+            condition_value=70,
+            bulk=1
+        ))
+
+    item = select_item_instance(state, {"mode": "by_item_id", "item_id": "kettle_spare"})
+    assert item is not None
+    assert item.instance_id == "tie_001"
+
+
 def test_select_item_instance_only_reachable():
     """Test that item selection only considers reachable items."""
     state = new_game()
@@ -521,3 +521,133 @@ def test_cannot_operate_on_same_item_twice():
     # Try to discard again (should fail)
     apply_action(state, "discard_desk_basic", rng_seed=124)
     assert len(state.items) == initial_count - 1
+
+
+def test_item_price_table_matches_metadata():
+    """Test that the per-field lookups agree with the full item metadata."""
+    from roomlife.engine import _get_item_metadata, _get_item_name, _get_item_price
+
+    for item_id in ("bed_standard", "kettle", "desk_worn", "not_a_real_item"):
+        assert _get_item_price(item_id) == _get_item_metadata(item_id).get("price", 0)
+        assert _get_item_name(item_id) == _get_item_metadata(item_id).get("name", item_id)
+
+
+def test_unknown_item_purchases_leave_no_cached_metadata():
+    """Test that bogus item ids from purchases are not remembered."""
+    from roomlife import engine
+
+    state = new_game()
+    state.player.money_pence = 100000
+    for i in range(20):
+        apply_action(state, f"purchase_bogus_item_{i}", rng_seed=i)
+
+    engine._get_item_metadata("kettle")
+    assert "bogus_item_0" not in engine._ITEM_METADATA_CACHE
+    first = engine._get_item_metadata("bogus_item_0")
+    assert first == {"name": "bogus_item_0", "price": 0, "quality": 1.0,
+                     "description": "", "tags": set()}
+    assert engine._get_item_metadata("bogus_item_0") is not first
+
+
+def test_compute_sell_price_matches_percentage_formula():
+    """Test integer sell price against exact 40%-of-condition arithmetic."""
+    from fractions import Fraction
+
+    from roomlife.action_engine import compute_sell_price
+
+    for base_price in (0, 250, 999, 2500, 6000):
+        for condition_value in range(0, 101):
+            exact = Fraction(base_price) * Fraction(2, 5) * Fraction(condition_value, 100)
+            assert compute_sell_price(base_price, condition_value) == max(100, int(exact))
+
+
+def test_sell_picks_lowest_condition_reachable_instance():
+    """Test that item_id selection skips other rooms and prefers the most worn copy."""
+    from roomlife.action_engine import _select_inventory_instance
+
+    state = new_game()
+    for placed_in, condition_value in (("room_001", 80), ("inventory", 40), ("hall_001", 5)):
+        state.items.append(Item(
+            instance_id=generate_instance_id(),
+            item_id="kettle",
+            placed_in=placed_in,
+            container=None,
+            slot="floor",
+            quality=1.0,
+            condition="used",
+            condition_value=condition_value,
+        ))
+
+    selected = _select_inventory_instance(state, "kettle")
+    assert selected is not None
+    assert selected.placed_in == "inventory"
+    assert selected.condition_value == 40
+    assert _select_inventory_instance(state, "not_a_real_item") is None
+
+
+def test_shared_purchase_validation_matches_per_item_validation():
+    """Test that sharing one purchase validation gives the same cards as validating each."""
+    from roomlife import engine
+    from roomlife.action_engine import param_values_affect_validation
+    from roomlife.catalog import ActionCatalog
+
+    state = new_game()
+    catalog = ActionCatalog(engine._ACTION_SPECS, engine._ITEM_META)
+    assert not param_values_affect_validation(engine._ACTION_SPECS["purchase_item"])
+    assert param_values_affect_validation(engine._ACTION_SPECS["repair_item"])
+    assert "purchase_item" in catalog._param_free_actions
+    param_free = catalog._param_free_actions
+
+    for money in (0, 300, 100000):
+        state.player.money_pence = money
+        shared = catalog._list_purchase_actions(state)
+        catalog._param_free_actions = frozenset()
+        separate = catalog._list_purchase_actions(state)
+        catalog._param_free_actions = param_free
+        assert shared == separate
+        assert all(a.missing_requirements is not b.missing_requirements
+                   for a, b in zip(shared[:-1], shared[1:], strict=True))
+
+
+def test_shared_listing_validation_matches_full_catalog():
+    """Test that every listing is unchanged when no validation is shared."""
+    from roomlife import engine
+    from roomlife.catalog import ActionCatalog
+
+    state = new_game()
+    state.items.append(Item(
+        instance_id=generate_instance_id(),
+        item_id="kettle",
+        placed_in="inventory",
+        container=None,
+        slot="inventory",
+        quality=1.0,
+        condition="used",
+        condition_value=60,
+    ))
+    catalog = ActionCatalog(engine._ACTION_SPECS, engine._ITEM_META)
+    assert {"sell_item", "discard_item", "apply_job"} <= catalog._param_free_actions
+
+    for money in (0, 100000):
+        state.player.money_pence = money
+        shared = catalog.list_available(state)
+        param_free = catalog._param_free_actions
+        catalog._param_free_actions = frozenset()
+        assert catalog.list_available(state) == shared
+        catalog._param_free_actions = param_free
+
+
+def test_base_action_calls_are_shared_read_only():
+    """Test that reused parameterless calls can't be edited by a caller."""
+    import pytest
+
+    from roomlife import engine
+    from roomlife.catalog import ActionCatalog
+
+    state = new_game()
+    catalog = ActionCatalog(engine._ACTION_SPECS, engine._ITEM_META)
+    card = next(c for c in catalog.list_available(state) if c.call.action_id == "rest")
+    with pytest.raises(TypeError):
+        card.call.params["target_space"] = "hall_001"
+    again = next(c for c in catalog.list_available(state) if c.call.action_id == "rest")
+    assert again.call.params == {}
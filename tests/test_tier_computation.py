@@ -532,3 +532,61 @@ def test_compute_tier_with_aptitude_weight():
 
     # With higher aptitude, tier should be higher
     assert tier_with_apt >= tier_no_apt
+
+
+def test_validation_context_item_lookups_match_item_scan():
+    """Test that a shared validation context picks the same items as a scan."""
+    from roomlife.action_engine import _find_best_item_for_provides, build_validation_context
+
+    state = new_game()
+    state.world.location = "kitchen_001"
+    for instance_id, placed_in, condition_value in (
+        ("stove_worn", "kitchen_001", 40),
+        ("stove_good", "kitchen_001", 90),
+        ("stove_elsewhere", "bedroom_001", 100),
+    ):
+        state.items.append(Item(
+            instance_id=instance_id,
+            item_id="stove",
+            placed_in=placed_in,
+            container=None,
+            slot="floor",
+            quality=1.0,
+            condition_value=condition_value,
+        ))
+    item_meta = {
+        "stove": ItemMeta(
+            id="stove",
+            name="Stove",
+            tags=["heat_source"],
+            provides=["heat_source"],
+            requires_utilities=[],
+            durability={"max": 100, "degrade_per_use_default": 1},
+        )
+    }
+    spec = ActionSpec(
+        id="test_cook",
+        display_name="Cook",
+        description="Test cooking",
+        category="survival",
+        time_minutes=30,
+        requires={},
+        modifiers={
+            "primary_skill": "cooking",
+            "item_provides_weights": {"heat_source": 0.5, "water_source": 0.5},
+        },
+        outcomes={},
+    )
+
+    ctx = build_validation_context(state, item_meta)
+    best = _find_best_item_for_provides(state, item_meta, "heat_source", "kitchen_001", ctx)
+    assert best.instance_id == "stove_good"
+    assert best is _find_best_item_for_provides(state, item_meta, "heat_source", "kitchen_001")
+    assert (
+        preview_tier_distribution(state, spec, item_meta, rng_seed=1, ctx=ctx)
+        == preview_tier_distribution(state, spec, item_meta, rng_seed=1)
+    )
+    assert (
+        build_preview_notes(state, spec, item_meta, None, ctx)
+        == build_preview_notes(state, spec, item_meta, None)
+    )